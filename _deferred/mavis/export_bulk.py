@@ -5,12 +5,43 @@ WAV audio generation, IML validation) and are set aside for potential
 future reintegration. They depend on the core mavis.export module.
 """
 
+import functools
 import json
 import os
-from typing import List
+import re
+import struct
+from typing import Dict, List, Tuple
 
+from mavis.audio import SAMPLE_RATE, MockAudioSynthesizer
 from mavis.export import PerformanceRecording, recording_to_dataset_entry
 
+# Optional Prosody-Protocol SDK validator, probed once at import
+try:
+    from prosody_protocol import IMLValidator  # type: ignore
+    _IML_VALIDATOR = IMLValidator()
+except ImportError:
+    _IML_VALIDATOR = None
+
+# 44-byte RIFF/WAVE header for 16-bit mono PCM:
+# RIFF, riff size, WAVE, "fmt ", fmt size, format, channels, sample rate,
+# byte rate, block align, bits per sample, "data", data size
+_WAV_HEADER = struct.Struct("<4sI4s4sIHHIIHH4sI")
+
+# Write buffer sizes for JSONL and streamed WAV export
+_JSONL_BUFFER_SIZE = 1 << 20
+_WAV_BUFFER_SIZE = 1 << 20
+
+# Shared synthesizer for audio generation (MockAudioSynthesizer is stateless)
+_SYNTH = MockAudioSynthesizer()
+
+# Tags whose open/close counts must balance in a valid IML document
+_BALANCED_TAGS = ("utterance", "prosody", "emphasis")
+
+# Matches "</tag>" (group 1) or "<tag" (group 2) for any balanced tag
+_TAG_RE = re.compile(
+    r"<(?:/({0})>|({0}))".format("|".join(_BALANCED_TAGS))
+)
+
 
 def export_dataset_jsonl(
     recordings: List[PerformanceRecording],
@@ -22,14 +53,16 @@ def export_dataset_jsonl(
     Only recordings with consent=True are included.
     Returns the number of entries written.
     """
-    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    _ensure_parent_dir(path)
     count = 0
-    with open(path, "w") as f:
+    # Large write buffer so lines are flushed in batches, not one syscall each
+    with open(path, "w", buffering=_JSONL_BUFFER_SIZE) as f:
         for rec in recordings:
             if not rec.consent:
                 continue
             entry = recording_to_dataset_entry(rec)
-            f.write(json.dumps(entry) + "\n")
+            f.write(json.dumps(entry))
+            f.write("\n")
             count += 1
     return count
 
@@ -43,15 +76,35 @@ def generate_audio_for_recording(
     Uses MockAudioSynthesizer to produce 16-bit PCM at 22050 Hz.
     Returns the output file path.
     """
-    from mavis.audio import MockAudioSynthesizer, SAMPLE_RATE
-
-    synth = MockAudioSynthesizer()
-    all_pcm = b""
-    for event in recording.phoneme_events:
-        all_pcm += synth.synthesize(event)
-
-    os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
-    _write_wav(output_path, all_pcm, sample_rate=SAMPLE_RATE)
+    # Recordings repeat the same phoneme/prosody combinations many times;
+    # synthesize each distinct one once. start_ms only positions the event
+    # and does not affect its samples, so it is left out of the key.
+    pcm_cache: Dict[tuple, bytes] = {}
+
+    _ensure_parent_dir(output_path)
+    # Stream PCM straight to disk behind a placeholder header, then patch
+    # in the real sizes once the total is known, so the whole recording is
+    # never concatenated in memory.
+    with open(output_path, "wb", buffering=_WAV_BUFFER_SIZE) as f:
+        f.write(_wav_header(0, SAMPLE_RATE))
+        data_size = 0
+        for event in recording.phoneme_events:
+            key = (
+                event.phoneme,
+                event.duration_ms,
+                event.volume,
+                event.pitch_hz,
+                event.vibrato,
+                event.breathiness,
+                tuple(event.harmony_intervals),
+            )
+            pcm = pcm_cache.get(key)
+            if pcm is None:
+                pcm = pcm_cache[key] = _SYNTH.synthesize(event)
+            f.write(pcm)
+            data_size += len(pcm)
+        f.seek(0)
+        f.write(_wav_header(data_size, SAMPLE_RATE))
     return output_path
 
 
@@ -60,58 +113,75 @@ def validate_iml(iml_string: str) -> List[str]:
 
     When the prosody_protocol SDK is installed, delegates to IMLValidator.
     Otherwise performs basic structural checks.
+
+    Results are memoized per document, so re-validating the same IML
+    string is a cache lookup.
     """
-    errors: List[str] = []
+    return list(_validate_iml_cached(iml_string))
+
 
+@functools.lru_cache(maxsize=256)
+def _validate_iml_cached(iml_string: str) -> Tuple[str, ...]:
+    """Validate an IML string, returning an immutable tuple of errors."""
     if "<iml" not in iml_string:
-        errors.append("Missing <iml> root element")
-        return errors
+        return ("Missing <iml> root element",)
     if "</iml>" not in iml_string:
-        errors.append("Missing </iml> closing tag")
-        return errors
+        return ("Missing </iml> closing tag",)
+
+    errors: List[str] = []
 
     if 'version="' not in iml_string:
         errors.append("Missing version attribute on <iml> element")
 
-    for tag in ["utterance", "prosody", "emphasis"]:
-        open_count = iml_string.count(f"<{tag}")
-        close_count = iml_string.count(f"</{tag}>")
+    # Tally every open/close tag in a single scan of the document
+    opened = dict.fromkeys(_BALANCED_TAGS, 0)
+    closed = dict.fromkeys(_BALANCED_TAGS, 0)
+    for match in _TAG_RE.finditer(iml_string):
+        close_tag, open_tag = match.groups()
+        if close_tag:
+            closed[close_tag] += 1
+        else:
+            opened[open_tag] += 1
+
+    for tag in _BALANCED_TAGS:
+        open_count = opened[tag]
+        close_count = closed[tag]
         if open_count != close_count:
             errors.append(
                 f"Unmatched <{tag}> tags: {open_count} opened, {close_count} closed"
             )
 
-    # Try the SDK validator if available
-    try:
-        from prosody_protocol import IMLValidator  # type: ignore
-        validator = IMLValidator()
-        sdk_errors = validator.validate(iml_string)
-        errors.extend(sdk_errors)
-    except ImportError:
-        pass
+    # Use the SDK validator if available
+    if _IML_VALIDATOR is not None:
+        errors.extend(_IML_VALIDATOR.validate(iml_string))
 
-    return errors
+    return tuple(errors)
 
 
 def _write_wav(path: str, pcm_data: bytes, sample_rate: int = 22050) -> None:
     """Write raw PCM data as a WAV file (16-bit mono)."""
-    import struct as _struct
-
-    data_size = len(pcm_data)
-    header = b"RIFF"
-    header += _struct.pack("<I", 36 + data_size)
-    header += b"WAVE"
-    header += b"fmt "
-    header += _struct.pack("<I", 16)
-    header += _struct.pack("<H", 1)    # PCM format
-    header += _struct.pack("<H", 1)    # mono
-    header += _struct.pack("<I", sample_rate)
-    header += _struct.pack("<I", sample_rate * 2)
-    header += _struct.pack("<H", 2)    # block align
-    header += _struct.pack("<H", 16)   # bits per sample
-    header += b"data"
-    header += _struct.pack("<I", data_size)
+    header = _wav_header(len(pcm_data), sample_rate)
 
+    # One write() for header + payload instead of two syscalls per file
     with open(path, "wb") as f:
-        f.write(header)
-        f.write(pcm_data)
+        f.write(header + pcm_data)
+
+
+def _ensure_parent_dir(path: str) -> None:
+    """Create the parent directory of ``path`` if it has one.
+
+    Bare filenames live in the current directory, which already exists,
+    so no mkdir/stat syscalls are issued for them.
+    """
+    dir_path = os.path.dirname(path)
+    if dir_path:
+        os.makedirs(dir_path, exist_ok=True)
+
+
+def _wav_header(data_size: int, sample_rate: int) -> bytes:
+    """Build the 44-byte WAV header for ``data_size`` bytes of 16-bit mono PCM."""
+    return _WAV_HEADER.pack(
+        b"RIFF", 36 + data_size, b"WAVE",
+        b"fmt ", 16, 1, 1, sample_rate, sample_rate * 2, 2, 16,
+        b"data", data_size,
+    )
@@ -8,16 +8,24 @@ analysis, including emotion classification, energy curves, and coaching
 suggestions.
 """
 
-from typing import Any, Dict, List, Optional
+import copy
+import http.client
+import json
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
 
 from mavis.export import (
     PerformanceRecording,
+    emotion_from_features,
     extract_training_features,
-    infer_emotion,
     phoneme_events_to_iml,
 )
 from mavis.llm_processor import PhonemeEvent
 
+# Number of distinct performances whose analysis results are kept
+_ANALYSIS_CACHE_SIZE = 128
+
 
 class IntentBridge:
     """Bridge to the intent-engine service for prosody analysis.
@@ -39,16 +47,15 @@ class IntentBridge:
         self.service_url = service_url.rstrip("/")
         self.timeout_s = timeout_s
         self._available: Optional[bool] = None
+        # Kept-alive connection to the service, opened on first request
+        self._conn: Optional[http.client.HTTPConnection] = None
+        # LRU of analysis results keyed by transcript + prosody fields
+        self._cache: "OrderedDict[tuple, Dict[str, Any]]" = OrderedDict()
 
     def is_available(self) -> bool:
         """Check if the intent-engine service is reachable."""
         try:
-            import urllib.request
-            req = urllib.request.Request(
-                f"{self.service_url}/health",
-                method="GET",
-            )
-            urllib.request.urlopen(req, timeout=self.timeout_s)
+            self._request("GET", "/health")
             self._available = True
             return True
         except Exception:
@@ -68,6 +75,10 @@ class IntentBridge:
         Returns:
             Dict with keys: dominant_emotion, energy_curve, intent_confidence,
             feedback, coaching_suggestions.
+
+        Results are cached per performance, so re-analyzing the same events
+        and transcript returns a copy of the earlier result without another
+        round trip or local pass.
         """
         phoneme_events = performance_data.get("phoneme_events", [])
         transcript = performance_data.get("transcript", "")
@@ -75,6 +86,22 @@ class IntentBridge:
         # Convert dict-form phoneme events to PhonemeEvent objects if needed
         events = _ensure_phoneme_events(phoneme_events)
 
+        key = _analysis_key(events, transcript)
+        cached = self._cache.get(key)
+        if cached is not None:
+            self._cache.move_to_end(key)
+            return copy.deepcopy(cached)
+
+        result = self._analyze_uncached(events, transcript)
+        self._cache[key] = result
+        if len(self._cache) > _ANALYSIS_CACHE_SIZE:
+            self._cache.popitem(last=False)
+        return copy.deepcopy(result)
+
+    def _analyze_uncached(
+        self, events: List[PhonemeEvent], transcript: str
+    ) -> Dict[str, Any]:
+        """Run remote analysis, falling back to local heuristics."""
         # Try remote analysis first
         if self._available is not False:
             try:
@@ -136,9 +163,6 @@ class IntentBridge:
         self, events: List[PhonemeEvent], transcript: str
     ) -> Dict[str, Any]:
         """Send analysis request to the intent-engine service."""
-        import json
-        import urllib.request
-
         iml = phoneme_events_to_iml(events, transcript=transcript)
         features = extract_training_features(events)
 
@@ -148,14 +172,69 @@ class IntentBridge:
             "transcript": transcript,
         }).encode("utf-8")
 
-        req = urllib.request.Request(
-            f"{self.service_url}/api/analyze",
-            data=payload,
-            headers={"Content-Type": "application/json"},
-            method="POST",
+        body = self._request(
+            "POST",
+            "/api/analyze",
+            payload,
+            {"Content-Type": "application/json"},
         )
-        resp = urllib.request.urlopen(req, timeout=self.timeout_s)
-        return json.loads(resp.read().decode("utf-8"))
+        return json.loads(body.decode("utf-8"))
+
+    def _request(
+        self,
+        method: str,
+        path: str,
+        body: Optional[bytes] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> bytes:
+        """Send a request to the service and return the response body.
+
+        Reuses one HTTP/1.1 connection across calls so repeated analyses skip
+        the TCP (and TLS) handshake. A kept-alive connection the server has
+        since closed is retried once on a fresh connection. Raises OSError
+        for HTTP error statuses, like urlopen() does.
+        """
+        reused = self._conn is not None
+        try:
+            return self._send(method, path, body, headers)
+        except (http.client.RemoteDisconnected, ConnectionError):
+            if not reused:
+                raise
+            return self._send(method, path, body, headers)
+
+    def _send(
+        self,
+        method: str,
+        path: str,
+        body: Optional[bytes],
+        headers: Optional[Dict[str, str]],
+    ) -> bytes:
+        """Issue one request, opening the connection if needed."""
+        parts = urlsplit(self.service_url)
+        if self._conn is None:
+            conn_cls = (
+                http.client.HTTPSConnection
+                if parts.scheme == "https"
+                else http.client.HTTPConnection
+            )
+            self._conn = conn_cls(parts.netloc, timeout=self.timeout_s)
+        try:
+            self._conn.request(method, parts.path + path, body=body, headers=headers or {})
+            resp = self._conn.getresponse()
+            data = resp.read()
+        except Exception:
+            # Drop the connection so the next call starts clean
+            self.close()
+            raise
+        if resp.status >= 400:
+            raise OSError(f"intent-engine returned HTTP {resp.status}")
+        return data
+
+    def close(self) -> None:
+        """Close the kept-alive connection to the service, if one is open."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
 
     def _local_analyze(
         self, events: List[PhonemeEvent], transcript: str
@@ -170,11 +249,11 @@ class IntentBridge:
                 "coaching_suggestions": [],
             }
 
-        features = extract_training_features(events)
-        emotion = infer_emotion(events)
-
-        # Compute energy curve (volume over time, in 10 segments)
-        energy_curve = _compute_energy_curve(events, segments=10)
+        # Features and energy curve (volume over time, in 10 segments) come
+        # from one fused traversal of the events
+        features, energy_curve = _compute_features_and_energy(events, segments=10)
+        # Reuse the feature means instead of re-scanning events for emotion
+        emotion = emotion_from_features(features)
 
         # Compute intent confidence from feature variance
         mean_vol = features[2]  # mean_volume
@@ -198,63 +277,126 @@ class IntentBridge:
         }
 
 
+def _analysis_key(events: List[PhonemeEvent], transcript: str) -> tuple:
+    """Build a cache key from the transcript and every analyzed event field."""
+    return (
+        transcript,
+        tuple(
+            (e.phoneme, e.duration_ms, e.volume, e.pitch_hz, e.vibrato, e.breathiness)
+            for e in events
+        ),
+    )
+
+
 def _ensure_phoneme_events(events: Any) -> List[PhonemeEvent]:
     """Convert dict-form events to PhonemeEvent objects if needed."""
     if not events:
         return []
     if isinstance(events[0], PhonemeEvent):
         return events
-    result = []
-    for e in events:
-        if isinstance(e, dict):
-            result.append(PhonemeEvent(
-                phoneme=e.get("phoneme", "?"),
-                start_ms=e.get("start_ms", 0),
-                duration_ms=e.get("duration_ms", 100),
-                volume=e.get("volume", 0.5),
-                pitch_hz=e.get("pitch_hz", 220.0),
-                vibrato=e.get("vibrato", False),
-                breathiness=e.get("breathiness", 0.0),
-                harmony_intervals=e.get("harmony_intervals", []),
-            ))
-        else:
-            result.append(e)
-    return result
+    # Built in one comprehension; dicts are the common case, and any
+    # already-converted events in a mixed list pass through unchanged
+    return [_event_from_dict(e) if isinstance(e, dict) else e for e in events]
+
+
+def _event_from_dict(e: Dict[str, Any]) -> PhonemeEvent:
+    """Build a PhonemeEvent from its dict form, defaulting missing fields."""
+    get = e.get
+    return PhonemeEvent(
+        phoneme=get("phoneme", "?"),
+        start_ms=get("start_ms", 0),
+        duration_ms=get("duration_ms", 100),
+        volume=get("volume", 0.5),
+        pitch_hz=get("pitch_hz", 220.0),
+        vibrato=get("vibrato", False),
+        breathiness=get("breathiness", 0.0),
+        harmony_intervals=get("harmony_intervals", []),
+    )
 
 
 def _compute_energy_curve(
     events: List[PhonemeEvent], segments: int = 10
 ) -> List[float]:
     """Compute energy (volume) over time, returning a list of segment averages."""
+    return _compute_features_and_energy(events, segments)[1]
+
+
+def _compute_features_and_energy(
+    events: List[PhonemeEvent], segments: int = 10
+) -> Tuple[List[float], List[float]]:
+    """Compute training features and the energy curve in one pass over events.
+
+    Returns ``(features, energy_curve)`` where ``features`` equals
+    ``extract_training_features(events)`` and ``energy_curve`` holds the
+    per-segment volume averages. Only the total duration, which fixes the
+    segment boundaries, is summed ahead of the main loop.
+    """
     if not events:
-        return []
+        return [0.0] * 7, []
     total_dur = sum(e.duration_ms for e in events)
-    if total_dur <= 0:
-        return [0.0] * segments
+
+    n = len(events)
+    pitch_sum = vol_sum = breath_sum = 0.0
+    min_pitch = max_pitch = events[0].pitch_hz
+    min_vol = max_vol = events[0].volume
+    vibrato_count = 0
 
     seg_dur = total_dur / segments
-    curve = []
-    seg_vols: List[float] = []
+    curve: List[float] = []
+    seg_sum = 0.0
+    seg_count = 0
     seg_end = seg_dur
     elapsed = 0.0
 
+    # Running sum/count per segment -- no per-segment list of volumes
     for event in events:
+        pitch = event.pitch_hz
+        vol = event.volume
+        pitch_sum += pitch
+        vol_sum += vol
+        breath_sum += event.breathiness
+        if pitch < min_pitch:
+            min_pitch = pitch
+        elif pitch > max_pitch:
+            max_pitch = pitch
+        if vol < min_vol:
+            min_vol = vol
+        elif vol > max_vol:
+            max_vol = vol
+        if event.vibrato:
+            vibrato_count += 1
+
         elapsed += event.duration_ms
-        seg_vols.append(event.volume)
+        seg_sum += vol
+        seg_count += 1
         if elapsed >= seg_end:
-            avg = sum(seg_vols) / len(seg_vols) if seg_vols else 0.0
-            curve.append(round(avg, 2))
-            seg_vols = []
+            curve.append(round(seg_sum / seg_count, 2))
+            seg_sum = 0.0
+            seg_count = 0
             seg_end += seg_dur
 
+    total_duration_s = total_dur / 1000.0
+    features = [
+        pitch_sum / n,                                          # mean_pitch_hz
+        max_pitch - min_pitch,                                  # pitch_range_hz
+        vol_sum / n,                                            # mean_volume
+        max_vol - min_vol,                                      # volume_range
+        breath_sum / n,                                         # mean_breathiness
+        n / total_duration_s if total_duration_s > 0 else 0.0,  # speech_rate
+        vibrato_count / n,                                      # vibrato_ratio
+    ]
+
+    if total_dur <= 0:
+        return features, [0.0] * segments
+
     # Flush remaining
-    if seg_vols:
-        curve.append(round(sum(seg_vols) / len(seg_vols), 2))
+    if seg_count:
+        curve.append(round(seg_sum / seg_count, 2))
 
     # Pad or trim to exact segment count
     while len(curve) < segments:
         curve.append(curve[-1] if curve else 0.0)
-    return curve[:segments]
+    return features, curve[:segments]
 
 
 def _generate_coaching(
@@ -280,8 +422,9 @@ def _generate_coaching(
             "Add sustain (...) to held notes for more expressive vibrato."
         )
     if len(energy_curve) >= 3:
-        mid = len(energy_curve) // 2
-        if all(abs(energy_curve[i] - energy_curve[0]) < 0.1 for i in range(len(energy_curve))):
+        # Flat when every segment is within 0.1 of the first one
+        first = energy_curve[0]
+        if max(energy_curve) - first < 0.1 and first - min(energy_curve) < 0.1:
             suggestions.append(
                 "Your energy was very flat. Try building intensity through the piece."
             )
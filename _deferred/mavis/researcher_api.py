@@ -14,7 +14,7 @@ import time
 import uuid
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
 
 from mavis.storage import atomic_json_save, locked_json_load
 
@@ -82,25 +82,31 @@ class PerformanceStore:
         self._save()
         return perf.perf_id
 
+    def record_many(self, perfs: List[AnonymizedPerformance]) -> List[str]:
+        """Store several performances with a single write. Returns their IDs.
+
+        Equivalent to calling ``record()`` for each one, but the store is
+        serialized and written once for the whole batch instead of per item.
+        """
+        ids = []
+        for perf in perfs:
+            self._performances[perf.perf_id] = perf.to_dict()
+            ids.append(perf.perf_id)
+        if ids:
+            self._save()
+        return ids
+
     def get(self, perf_id: str) -> Optional[AnonymizedPerformance]:
         """Get a performance by ID."""
         data = self._performances.get(perf_id)
         if data is None:
             return None
-        return AnonymizedPerformance(
-            perf_id=data["id"],
-            song_id=data["song_id"],
-            difficulty=data["difficulty"],
-            score=data["score"],
-            grade=data["grade"],
-            token_count=data["token_count"],
-            phoneme_count=data["phoneme_count"],
-            emotion=data["emotion"],
-            features=data["features"],
-            iml=data["iml"],
-            timestamp=data["timestamp"],
-            metadata=data.get("metadata", {}),
-        )
+        return _performance_from_dict(data)
+
+    def iter_performances(self) -> Iterator[AnonymizedPerformance]:
+        """Yield every stored performance, building one record at a time."""
+        for data in self._performances.values():
+            yield _performance_from_dict(data)
 
     def query(
         self,
@@ -111,7 +117,7 @@ class PerformanceStore:
         offset: int = 0,
     ) -> List[AnonymizedPerformance]:
         """Query performances with optional filters."""
-        results = []
+        matches = []
         for data in self._performances.values():
             if song_id and data.get("song_id") != song_id:
                 continue
@@ -119,24 +125,12 @@ class PerformanceStore:
                 continue
             if min_score is not None and data.get("score", 0) < min_score:
                 continue
-            results.append(AnonymizedPerformance(
-                perf_id=data["id"],
-                song_id=data["song_id"],
-                difficulty=data["difficulty"],
-                score=data["score"],
-                grade=data["grade"],
-                token_count=data["token_count"],
-                phoneme_count=data["phoneme_count"],
-                emotion=data["emotion"],
-                features=data["features"],
-                iml=data["iml"],
-                timestamp=data["timestamp"],
-                metadata=data.get("metadata", {}),
-            ))
-
-        # Sort by timestamp descending (newest first)
-        results.sort(key=lambda p: p.timestamp, reverse=True)
-        return results[offset: offset + limit]
+            matches.append(data)
+
+        # Sort by timestamp descending (newest first), then build records
+        # only for the requested page
+        matches.sort(key=lambda d: d["timestamp"], reverse=True)
+        return [_performance_from_dict(d) for d in matches[offset: offset + limit]]
 
     def statistics(self) -> Dict[str, Any]:
         """Compute aggregate statistics across all performances."""
@@ -309,14 +303,15 @@ class APIKeyStore:
 
     def validate(self, raw_key: str) -> Optional[str]:
         """Validate an API key. Returns key_id if valid, None otherwise."""
+        # Keys issued by register() embed their key_id ("mavis_<key_id>_..."),
+        # so check that one record directly instead of hashing against all
+        parts = raw_key.split("_")
+        if len(parts) == 3 and parts[0] == "mavis" and parts[1] in self._keys:
+            key_id = parts[1]
+            return key_id if _key_matches(self._keys[key_id], raw_key) else None
+
         for key_id, data in self._keys.items():
-            salt = data.get("key_salt", "")
-            if salt:
-                key_hash = hashlib.sha256(f"{salt}:{raw_key}".encode()).hexdigest()
-            else:
-                # Legacy unsalted keys
-                key_hash = hashlib.sha256(raw_key.encode()).hexdigest()
-            if _hmac_mod.compare_digest(data.get("key_hash", ""), key_hash):
+            if _key_matches(data, raw_key):
                 return key_id
         return None
 
@@ -354,3 +349,32 @@ class APIKeyStore:
     def key_count(self) -> int:
         """Total number of registered keys."""
         return len(self._keys)
+
+
+def _performance_from_dict(data: dict) -> AnonymizedPerformance:
+    """Rebuild an AnonymizedPerformance from its stored dict form."""
+    return AnonymizedPerformance(
+        perf_id=data["id"],
+        song_id=data["song_id"],
+        difficulty=data["difficulty"],
+        score=data["score"],
+        grade=data["grade"],
+        token_count=data["token_count"],
+        phoneme_count=data["phoneme_count"],
+        emotion=data["emotion"],
+        features=data["features"],
+        iml=data["iml"],
+        timestamp=data["timestamp"],
+        metadata=data.get("metadata", {}),
+    )
+
+
+def _key_matches(data: dict, raw_key: str) -> bool:
+    """Check a plaintext key against a stored key record's hash."""
+    salt = data.get("key_salt", "")
+    if salt:
+        key_hash = hashlib.sha256(f"{salt}:{raw_key}".encode()).hexdigest()
+    else:
+        # Legacy unsalted keys
+        key_hash = hashlib.sha256(raw_key.encode()).hexdigest()
+    return _hmac_mod.compare_digest(data.get("key_hash", ""), key_hash)
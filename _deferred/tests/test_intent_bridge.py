@@ -1,6 +1,15 @@
 """Tests for mavis.intent_bridge -- prosody-aware analysis of performances."""
 
-from mavis.intent_bridge import IntentBridge, _compute_energy_curve, _generate_coaching
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from mavis.intent_bridge import (
+    IntentBridge,
+    _compute_energy_curve,
+    _compute_features_and_energy,
+    _generate_coaching,
+)
 from mavis.export import PerformanceRecording, extract_training_features
 from mavis.llm_processor import PhonemeEvent
 
@@ -24,6 +33,61 @@ def test_bridge_is_available_offline():
     assert not bridge.is_available()
 
 
+def test_remote_analyze_reuses_connection():
+    client_ports = []
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_POST(self):
+            client_ports.append(self.client_address[1])
+            self.rfile.read(int(self.headers["Content-Length"]))
+            body = json.dumps({"dominant_emotion": "calm"}).encode()
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        bridge = IntentBridge(service_url=f"http://127.0.0.1:{server.server_port}")
+        for volume in (0.4, 0.6):
+            data = {"phoneme_events": [_make_event(volume=volume)]}
+            assert bridge.analyze(data)["dominant_emotion"] == "calm"
+        assert len(client_ports) == 2
+        assert client_ports[0] == client_ports[1]
+        bridge.close()
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_analyze_caches_repeated_performance():
+    bridge = IntentBridge()
+    bridge._available = False
+    calls = []
+    local = bridge._local_analyze
+
+    def counting_local(events, transcript):
+        calls.append(transcript)
+        return local(events, transcript)
+
+    bridge._local_analyze = counting_local
+    data = {"phoneme_events": [_make_event(volume=0.9)], "transcript": "hi"}
+    first = bridge.analyze(data)
+    first["coaching_suggestions"].append("mutated")
+    second = bridge.analyze(data)
+    assert len(calls) == 1
+    assert "mutated" not in second["coaching_suggestions"]
+    bridge.analyze({"phoneme_events": [_make_event(volume=0.2)], "transcript": "hi"})
+    assert len(calls) == 2
+
+
 def test_local_analyze_empty():
     bridge = IntentBridge()
     bridge._available = False
@@ -125,6 +189,15 @@ def test_compute_energy_curve_empty():
     assert curve == []
 
 
+def test_compute_features_and_energy_matches_separate_passes():
+    events = [_make_event(volume=0.3, pitch_hz=200.0, vibrato=True) for _ in range(4)]
+    events += [_make_event(volume=0.9, pitch_hz=300.0, breathiness=0.5) for _ in range(6)]
+    features, curve = _compute_features_and_energy(events, segments=5)
+    assert features == extract_training_features(events)
+    assert curve == _compute_energy_curve(events, segments=5)
+    assert len(curve) == 5
+
+
 def test_generate_coaching_flat():
     features = [220.0, 0.0, 0.5, 0.05, 0.01, 5.0, 0.05]
     curve = [0.5] * 10
@@ -39,6 +39,20 @@ def test_store_record_and_get():
         os.unlink(path)
 
 
+def test_store_record_many():
+    with tempfile.NamedTemporaryFile(suffix=".json", delete=False) as f:
+        path = f.name
+    try:
+        store = PerformanceStore(path=path)
+        ids = store.record_many([_make_perf(perf_id=f"p{i}") for i in range(3)])
+        assert ids == ["p0", "p1", "p2"]
+        reloaded = PerformanceStore(path=path)
+        assert reloaded.count() == 3
+        assert reloaded.get("p2") is not None
+    finally:
+        os.unlink(path)
+
+
 def test_store_get_missing():
     with tempfile.NamedTemporaryFile(suffix=".json", delete=False) as f:
         path = f.name
@@ -122,6 +136,18 @@ def test_store_query_pagination():
         os.unlink(path)
 
 
+def test_store_iter_performances():
+    with tempfile.NamedTemporaryFile(suffix=".json", delete=False) as f:
+        path = f.name
+    try:
+        store = PerformanceStore(path=path)
+        store.record_many([_make_perf(perf_id=f"p{i}") for i in range(3)])
+        perfs = list(store.iter_performances())
+        assert sorted(p.perf_id for p in perfs) == ["p0", "p1", "p2"]
+    finally:
+        os.unlink(path)
+
+
 def test_store_statistics():
     with tempfile.NamedTemporaryFile(suffix=".json", delete=False) as f:
         path = f.name
@@ -215,6 +241,20 @@ def test_api_key_validate_invalid():
         os.unlink(path)
 
 
+def test_api_key_validate_wrong_secret_for_known_id():
+    with tempfile.NamedTemporaryFile(suffix=".json", delete=False) as f:
+        path = f.name
+    try:
+        store = APIKeyStore(path=path)
+        raw_keys = [store.register(f"Owner {i}") for i in range(5)]
+        for raw_key in raw_keys:
+            assert store.validate(raw_key) == raw_key.split("_")[1]
+        forged = raw_keys[2].rsplit("_", 1)[0] + "_" + "0" * 16
+        assert store.validate(forged) is None
+    finally:
+        os.unlink(path)
+
+
 def test_api_key_rate_limit():
     with tempfile.NamedTemporaryFile(suffix=".json", delete=False) as f:
         path = f.name
@@ -42,14 +42,46 @@ SUSTAIN_CHAR_FILL = "\u2588"
 SUSTAIN_CHAR_PARTIAL = "\u2593"
 SUSTAIN_CHAR_EMPTY = "\u2591"
 
+# Full-width bar runs; bars draw a prefix of them with addnstr, so no
+# bar string is built per frame (bars are at most SUSTAIN_MAX_WIDTH cells)
+_FILL_RUN = SUSTAIN_CHAR_FILL * SUSTAIN_MAX_WIDTH
+_EMPTY_RUN = SUSTAIN_CHAR_EMPTY * SUSTAIN_MAX_WIDTH
+
+# Per-keycode (char, shift, ctrl) for the 8-bit keys play_game feeds
+_KEY_TABLE = [(chr(k), chr(k).isupper(), k < 32) for k in range(256)]
+
+# Typed characters kept for the "Your input" line (wider than any terminal)
+TYPED_TAIL_MAX = 512
+
+# Curses attributes, resolved once by _init_attrs() after the color pairs
+# exist (color_pair() cannot be called before curses is initialized)
+ATTR_HEADER = 0
+ATTR_STATUS_OK = 0
+ATTR_STATUS_WARN = 0
+ATTR_STATUS_ERR = 0
+_STATUS_ATTRS = {}
+
+
+def _init_attrs():
+    """Resolve the module's curses attribute constants (call after init_pair)."""
+    global ATTR_HEADER, ATTR_STATUS_OK, ATTR_STATUS_WARN, ATTR_STATUS_ERR
+    ATTR_HEADER = curses.A_BOLD | curses.color_pair(4)
+    ATTR_STATUS_OK = curses.color_pair(1)  # green
+    ATTR_STATUS_WARN = curses.color_pair(2)  # yellow
+    ATTR_STATUS_ERR = curses.color_pair(3)  # red
+    _STATUS_ATTRS.clear()
+    _STATUS_ATTRS.update(optimal=ATTR_STATUS_OK, overflow=ATTR_STATUS_WARN)
+
 
 def draw_bar(win, y, x, level, width, label=""):
     """Draw a horizontal bar with optional label."""
     filled = int(level * width)
-    empty = width - filled
-    bar_str = SUSTAIN_CHAR_FILL * filled + SUSTAIN_CHAR_EMPTY * empty
     try:
-        win.addstr(y, x, f"{label}[{bar_str}] {level:.0%}")
+        win.addstr(y, x, label)
+        win.addstr("[")
+        win.addnstr(_FILL_RUN, filled)
+        win.addnstr(_EMPTY_RUN, width - filled)
+        win.addstr(f"] {level:.0%}")
     except curses.error:
         pass
 
@@ -62,29 +94,37 @@ def draw_sustain_bar(win, y, x, hold_ms, target_ms):
 
     diff = abs(hold_ms - target_ms) / target_ms if target_ms > 0 else 1.0
     if diff <= 0.2:
-        color = curses.color_pair(1)  # green
+        color = ATTR_STATUS_OK
     elif diff <= 0.5:
-        color = curses.color_pair(2)  # yellow
+        color = ATTR_STATUS_WARN
     else:
-        color = curses.color_pair(3)  # red
+        color = ATTR_STATUS_ERR
 
     try:
         win.addstr(y, x, "Sustain: [", curses.A_BOLD)
-        win.addstr(SUSTAIN_CHAR_FILL * filled, color | curses.A_BOLD)
-        win.addstr(SUSTAIN_CHAR_EMPTY * empty)
+        win.addnstr(_FILL_RUN, filled, color | curses.A_BOLD)
+        win.addnstr(_EMPTY_RUN, empty)
         win.addstr(f"] {hold_ms:.0f}ms / {target_ms:.0f}ms")
     except curses.error:
         pass
 
 
+def _row_changed(win, prev_rows, y, content):
+    """Return True, after clearing row y, if its content differs from last frame."""
+    if prev_rows.get(y) == content:
+        return False
+    prev_rows[y] = content
+    try:
+        win.move(y, 0)
+        win.clrtoeol()
+    except curses.error:
+        pass
+    return True
+
+
 def status_attr(status):
     """Return curses attribute for buffer status."""
-    if status == "optimal":
-        return curses.color_pair(1)
-    elif status == "overflow":
-        return curses.color_pair(2)
-    else:
-        return curses.color_pair(3)
+    return _STATUS_ATTRS.get(status, ATTR_STATUS_ERR)
 
 
 # --- Menu helpers ---
@@ -94,7 +134,7 @@ def draw_menu(stdscr, title, items, selected):
     stdscr.erase()
     h, w = stdscr.getmaxyx()
     try:
-        stdscr.addstr(0, 0, title, curses.A_BOLD | curses.color_pair(4))
+        stdscr.addstr(0, 0, title, ATTR_HEADER)
         stdscr.addstr(1, 0, "-" * min(w - 1, 60))
     except curses.error:
         pass
@@ -220,7 +260,7 @@ def leaderboard_menu(stdscr):
     stdscr.erase()
     h, w = stdscr.getmaxyx()
     try:
-        stdscr.addstr(0, 0, "Leaderboard", curses.A_BOLD | curses.color_pair(4))
+        stdscr.addstr(0, 0, "Leaderboard", ATTR_HEADER)
         stdscr.addstr(1, 0, "-" * min(w - 1, 60))
     except curses.error:
         pass
@@ -293,8 +333,10 @@ def play_game(stdscr, song, difficulty_name="medium", voice_name="default"):
     pipe = create_pipeline(config)
     tracker = ScoreTracker()
 
-    typed_text = []
-    phonemes_played = []
+    sheet_lines = song.sheet_text.split("\n") if song else []
+    typed_text = ""
+    chars_typed = 0
+    phonemes_played = 0
     sustain_start = None
     sustain_active = False
     sustain_hold_ms = 0.0
@@ -302,165 +344,211 @@ def play_game(stdscr, song, difficulty_name="medium", voice_name="default"):
     dot_count = 0
 
     curses.curs_set(0)
-    stdscr.nodelay(True)
-    stdscr.timeout(33)
+    # Block in getch for up to one frame (~30 FPS) instead of polling
+    stdscr.nodelay(False)
+    input_timeout_ms = 33
+    stdscr.timeout(input_timeout_ms)
+
+    # Header text is fixed for the whole song, so build it once
+    title = "Mavis Interactive Vocal Typing"
+    if song:
+        title += f" - {song.title}"
+    if pipe.difficulty:
+        title += f" [{pipe.difficulty.name}]"
+    if pipe.voice:
+        title += f" ({pipe.voice.name})"
 
     running = True
     frame = 0
+    last_frame_key = None
+    last_layout_key = None
+    input_row = 0
+    # Screen row -> content last drawn there, for the dynamic rows
+    prev_rows = {}
 
     while running:
         frame += 1
-        stdscr.erase()
-        h, w = stdscr.getmaxyx()
 
-        # Header
-        title = "Mavis Interactive Vocal Typing"
-        if song:
-            title += f" - {song.title}"
-        if pipe.difficulty:
-            title += f" [{pipe.difficulty.name}]"
-        if pipe.voice:
-            title += f" ({pipe.voice.name})"
-        try:
-            stdscr.addstr(0, 0, title[:w - 1], curses.A_BOLD | curses.color_pair(4))
-            stdscr.addstr(1, 0, "-" * min(w - 1, 60))
-        except curses.error:
-            pass
-
-        # Read keyboard input
-        try:
-            key = stdscr.getch()
-        except Exception:
-            key = -1
+        # Read keyboard input; returns -1 once the frame timeout elapses.
+        # Halve the wait while a note is sustained so the hold time is tracked
+        # at a finer granularity.
+        frame_timeout_ms = 16 if sustain_active else 33
+        if frame_timeout_ms != input_timeout_ms:
+            input_timeout_ms = frame_timeout_ms
+            stdscr.timeout(input_timeout_ms)
+        key = stdscr.getch()
 
         if key == 27:  # Esc
             running = False
             continue
 
-        if key != -1 and key < 256 and key != curses.ERR:
-            char = chr(key)
-            shift = char.isupper()
-            ctrl = key < 32
+        # One clock read per frame, shared by all sustain timing below
+        now = time.monotonic()
+
+        if 0 <= key < 256:
+            char, shift, ctrl = _KEY_TABLE[key]
             mods = {"shift": shift, "ctrl": ctrl, "alt": False}
             pipe.feed(char, mods)
-            typed_text.append(char)
+            # Rolling tail of the input, updated per key rather than per frame
+            typed_text = (typed_text + char)[-TYPED_TAIL_MAX:]
+            chars_typed += 1
 
             if char == ".":
                 dot_count += 1
                 if dot_count == 3:
                     sustain_active = True
-                    sustain_start = time.monotonic()
+                    sustain_start = now
                     dot_count = 0
             else:
                 if sustain_active:
-                    sustain_hold_ms = (time.monotonic() - sustain_start) * 1000
+                    sustain_hold_ms = (now - sustain_start) * 1000
                     sustain_active = False
                 dot_count = 0
 
         if sustain_active and sustain_start:
-            sustain_hold_ms = (time.monotonic() - sustain_start) * 1000
+            sustain_hold_ms = (now - sustain_start) * 1000
 
         # Tick the pipeline
-        state = pipe.tick()
-        buf_state = pipe.output_buffer.state()
+        state, buf_state = pipe.tick_with_buffer_state()
         tracker.on_tick(buf_state)
 
         if state["last_phoneme"]:
-            phonemes_played.append(state["last_phoneme"])
+            phonemes_played += 1
 
-        # Song text display
-        row = 3
-        if song:
+        # Skip the redraw entirely when nothing on screen would change. Each
+        # value is keyed at the precision it is displayed with (the sustain
+        # time is shown rounded to whole milliseconds).
+        h, w = stdscr.getmaxyx()
+        shown_tokens = tuple(state["last_tokens"][:5])
+        score = tracker.score()
+        grade = tracker.grade()
+        frame_key = (
+            h, w, chars_typed, phonemes_played,
+            state["last_phoneme"], shown_tokens,
+            state["input_buffer_level"], state["output_buffer_level"],
+            state["output_buffer_status"], score, grade,
+            sustain_active, round(sustain_hold_ms),
+        )
+        if frame_key == last_frame_key:
+            continue
+        last_frame_key = frame_key
+
+        # Static regions (header, labels, sheet text, instructions) only move
+        # when the terminal is resized or the sustain bar appears/disappears
+        show_sustain = sustain_active or sustain_hold_ms > 0
+        layout_key = (h, w, show_sustain)
+        if layout_key != last_layout_key:
+            last_layout_key = layout_key
+            stdscr.erase()
+            prev_rows.clear()
+
+            # Header
             try:
-                stdscr.addstr(row, 0, "Sheet Text:", curses.A_BOLD)
+                stdscr.addstr(0, 0, title[:w - 1], ATTR_HEADER)
+                stdscr.addstr(1, 0, "-" * min(w - 1, 60))
             except curses.error:
                 pass
-            row += 1
-            sheet_lines = song.sheet_text.split("\n")
-            for line in sheet_lines:
+
+            # Song text display
+            row = 3
+            if song:
                 try:
-                    stdscr.addstr(row, 2, line[:w - 4])
+                    stdscr.addstr(row, 0, "Sheet Text:", curses.A_BOLD)
                 except curses.error:
                     pass
                 row += 1
-            row += 1
+                for line in sheet_lines:
+                    try:
+                        stdscr.addnstr(row, 2, line, max(w - 4, 0))
+                    except curses.error:
+                        pass
+                    row += 1
+                row += 1
+            input_row = row
 
-        # Typed text
-        try:
-            stdscr.addstr(row, 0, "Your input:", curses.A_BOLD)
-        except curses.error:
-            pass
-        row += 1
-        display_typed = "".join(typed_text[-(w - 4):])
-        try:
-            stdscr.addstr(row, 2, display_typed)
-        except curses.error:
-            pass
-        row += 2
+            try:
+                stdscr.addstr(input_row, 0, "Your input:", curses.A_BOLD)
+                stdscr.addstr(input_row + 3, 0, "Buffers:", curses.A_BOLD)
+            except curses.error:
+                pass
 
-        # Buffer visualizations
-        try:
-            stdscr.addstr(row, 0, "Buffers:", curses.A_BOLD)
-        except curses.error:
-            pass
-        row += 1
-        draw_bar(stdscr, row, 2, state["input_buffer_level"], 20, "IN  ")
+            # Instructions
+            row = input_row + 13 + (2 if show_sustain else 0)
+            try:
+                stdscr.addstr(min(row, h - 2), 0,
+                              "Type to sing! CAPS=loud  _word_=soft  ...=sustain  "
+                              "[word]=harmony  Esc=quit")
+            except curses.error:
+                pass
+
+        # Dynamic rows: each is cleared and redrawn only when its content changed
+        row = input_row + 1
+        display_typed = typed_text[-(w - 4):]
+        if _row_changed(stdscr, prev_rows, row, display_typed):
+            try:
+                stdscr.addstr(row, 2, display_typed)
+            except curses.error:
+                pass
+        row += 3
+
+        in_level = state["input_buffer_level"]
+        if _row_changed(stdscr, prev_rows, row, in_level):
+            draw_bar(stdscr, row, 2, in_level, 20, "IN  ")
         row += 1
 
         st = state["output_buffer_status"]
-        attr = status_attr(st)
-        draw_bar(stdscr, row, 2, state["output_buffer_level"], 20, "OUT ")
-        try:
-            stdscr.addstr(row, 32, f" {st}", attr | curses.A_BOLD)
-        except curses.error:
-            pass
+        out_level = state["output_buffer_level"]
+        if _row_changed(stdscr, prev_rows, row, (out_level, st)):
+            draw_bar(stdscr, row, 2, out_level, 20, "OUT ")
+            try:
+                stdscr.addstr(row, 32, f" {st}", status_attr(st) | curses.A_BOLD)
+            except curses.error:
+                pass
         row += 2
 
         # Sustain bar
-        if sustain_active or sustain_hold_ms > 0:
-            draw_sustain_bar(stdscr, row, 2, sustain_hold_ms, sustain_target_ms)
+        if show_sustain:
+            if _row_changed(stdscr, prev_rows, row, round(sustain_hold_ms)):
+                draw_sustain_bar(stdscr, row, 2, sustain_hold_ms, sustain_target_ms)
             row += 2
 
         # Current phoneme
         ph = state["last_phoneme"] or "-"
-        try:
-            stdscr.addstr(row, 0, f"Phoneme: {ph}", curses.A_BOLD)
-        except curses.error:
-            pass
+        if _row_changed(stdscr, prev_rows, row, ph):
+            try:
+                stdscr.addstr(row, 0, f"Phoneme: {ph}", curses.A_BOLD)
+            except curses.error:
+                pass
         row += 1
 
-        tokens_str = " ".join(state["last_tokens"][:5]) if state["last_tokens"] else "-"
-        try:
-            stdscr.addstr(row, 0, f"Tokens:  {tokens_str}")
-        except curses.error:
-            pass
+        # Rows are keyed on raw values; strings are only built for rows redrawn
+        if _row_changed(stdscr, prev_rows, row, shown_tokens):
+            tokens_str = " ".join(shown_tokens) if shown_tokens else "-"
+            try:
+                stdscr.addstr(row, 0, f"Tokens:  {tokens_str}")
+            except curses.error:
+                pass
         row += 2
 
         # Score
-        try:
-            stdscr.addstr(row, 0, f"Score: {tracker.score()}  Grade: {tracker.grade()}",
-                          curses.A_BOLD)
-        except curses.error:
-            pass
+        if _row_changed(stdscr, prev_rows, row, (score, grade)):
+            try:
+                stdscr.addstr(row, 0, f"Score: {score}  Grade: {grade}", curses.A_BOLD)
+            except curses.error:
+                pass
         row += 1
-        try:
-            stdscr.addstr(row, 0, f"Phonemes played: {len(phonemes_played)}")
-        except curses.error:
-            pass
-        row += 2
-
-        # Instructions
-        try:
-            stdscr.addstr(min(row, h - 2), 0,
-                          "Type to sing! CAPS=loud  _word_=soft  ...=sustain  "
-                          "[word]=harmony  Esc=quit")
-        except curses.error:
-            pass
+        if _row_changed(stdscr, prev_rows, row, phonemes_played):
+            try:
+                stdscr.addstr(row, 0, f"Phonemes played: {phonemes_played}")
+            except curses.error:
+                pass
 
-        stdscr.refresh()
+        # Stage the frame and flush it to the terminal in one update
+        stdscr.noutrefresh()
+        curses.doupdate()
 
     # Return final results
-    return tracker.score(), tracker.grade(), len(phonemes_played), len(typed_text)
+    return tracker.score(), tracker.grade(), phonemes_played, chars_typed
 
 
 def show_results(stdscr, score, grade, phonemes, chars, song=None):
@@ -469,7 +557,7 @@ def show_results(stdscr, score, grade, phonemes, chars, song=None):
     stdscr.nodelay(False)
     stdscr.timeout(-1)
     try:
-        stdscr.addstr(2, 0, "Performance Complete!", curses.A_BOLD | curses.color_pair(4))
+        stdscr.addstr(2, 0, "Performance Complete!", ATTR_HEADER)
         if song:
             stdscr.addstr(3, 0, f"Song: {song.title}")
         stdscr.addstr(5, 0, f"Final Score: {score}")
@@ -516,6 +604,7 @@ def main(stdscr):
     curses.init_pair(2, curses.COLOR_YELLOW, -1)
     curses.init_pair(3, curses.COLOR_RED, -1)
     curses.init_pair(4, curses.COLOR_CYAN, -1)
+    _init_attrs()
 
     # Check for direct song argument
     if len(sys.argv) > 1 and os.path.isfile(sys.argv[1]):
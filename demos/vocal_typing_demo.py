@@ -3,8 +3,13 @@
 
 Feeds a hardcoded Sheet Text string through the Mavis pipeline and
 prints buffer states and phoneme events to the terminal in real time.
+
+Usage:
+  python3 demos/vocal_typing_demo.py          # Real-time playback
+  python3 demos/vocal_typing_demo.py --fast   # No typing/drain delays
 """
 
+import functools
 import sys
 import time
 
@@ -17,15 +22,21 @@ from mavis.scoring import ScoreTracker
 
 def bar(level: float, width: int = 20) -> str:
     """Render a horizontal bar: [████░░░░░░]"""
-    filled = int(level * width)
-    empty = width - filled
-    return "[" + "\u2588" * filled + "\u2591" * empty + "]"
+    return _bar_cells(int(level * width), width)
+
+
+@functools.lru_cache(maxsize=64)
+def _bar_cells(filled: int, width: int) -> str:
+    """Build the bar string for a fill count (only width + 1 distinct values)."""
+    return "[" + "\u2588" * filled + "\u2591" * (width - filled) + "]"
+
+
+STATUS_COLORS = {"underflow": "\033[91m", "optimal": "\033[92m", "overflow": "\033[93m"}
 
 
 def status_color(status: str) -> str:
     """ANSI color prefix for buffer status."""
-    colors = {"underflow": "\033[91m", "optimal": "\033[92m", "overflow": "\033[93m"}
-    return colors.get(status, "")
+    return STATUS_COLORS.get(status, "")
 
 
 RESET = "\033[0m"
@@ -45,11 +56,14 @@ def main():
     tracker = ScoreTracker()
 
     # Simulate typing at ~60 WPM (1 char every 200ms, 5 chars/word)
-    char_delay = 0.15
+    fast = "--fast" in sys.argv[1:]
+    char_delay = 0.0 if fast else 0.15
+    drain_delay = 0.0 if fast else 0.05
 
     # Feed all characters with a simulated delay
     chars_fed = 0
     total = len(DEMO_TEXT)
+    last_line = ""
 
     print(f"Simulating typing at ~60 WPM ({total} characters)...\n")
 
@@ -59,8 +73,7 @@ def main():
         chars_fed += 1
 
         # Tick the pipeline
-        state = pipe.tick()
-        buf_state = pipe.output_buffer.state()
+        state, buf_state = pipe.tick_with_buffer_state()
         tracker.on_tick(buf_state)
 
         # Display
@@ -72,38 +85,43 @@ def main():
         phoneme_str = state["last_phoneme"] or "-"
         token_str = " ".join(state["last_tokens"][:3]) if state["last_tokens"] else "-"
 
-        sys.stdout.write(
+        line = (
             f"\r  Typed: {chars_fed:3d}/{total}  "
             f"IN {in_bar}  "
             f"OUT {color}{out_bar} {st:10s}{RESET}  "
             f"Token: {token_str:12s}  "
             f"Phoneme: {phoneme_str:4s}"
         )
-        sys.stdout.flush()
+        # One write + flush per frame, and none when the line is unchanged
+        if line != last_line:
+            sys.stdout.write(line)
+            sys.stdout.flush()
+            last_line = line
 
-        time.sleep(char_delay)
+        if char_delay:
+            time.sleep(char_delay)
 
     # Drain remaining output buffer
     print("\n\n  Draining output buffer...")
-    drain_ticks = 0
-    while pipe.output_buffer.size() > 0 and drain_ticks < 200:
-        state = pipe.tick()
-        buf_state = pipe.output_buffer.state()
+    for state, buf_state in pipe.drain(max_ticks=200):
         tracker.on_tick(buf_state)
-        drain_ticks += 1
 
         out_bar = bar(state["output_buffer_level"])
         st = state["output_buffer_status"]
         color = status_color(st)
         phoneme_str = state["last_phoneme"] or "-"
 
-        sys.stdout.write(
+        line = (
             f"\r  Drain: {color}{out_bar} {st:10s}{RESET}  "
             f"Phoneme: {phoneme_str:4s}  "
             f"Remaining: {state['output_buffer_size']:3d}"
         )
-        sys.stdout.flush()
-        time.sleep(0.05)
+        if line != last_line:
+            sys.stdout.write(line)
+            sys.stdout.flush()
+            last_line = line
+        if drain_delay:
+            time.sleep(drain_delay)
 
     print("\n")
     print("=" * 60)
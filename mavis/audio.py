@@ -1,15 +1,20 @@
 """Audio synthesis -- converts PhonemeEvents into audio waveform data."""
 
 import abc
+import array
+import functools
 import math
-import struct
-from typing import List
+import sys
+from typing import Tuple
 
 from mavis.llm_processor import PhonemeEvent
 
 SAMPLE_RATE = 22050
 SAMPLE_WIDTH = 2  # 16-bit
 
+# PCM is little-endian; array.array uses native byte order
+_BIG_ENDIAN = sys.byteorder == "big"
+
 
 class AudioSynthesizer(abc.ABC):
     """Abstract base class for audio synthesis backends."""
@@ -30,40 +35,15 @@ class MockAudioSynthesizer(AudioSynthesizer):
     """
 
     def synthesize(self, event: PhonemeEvent) -> bytes:
-        num_samples = int(SAMPLE_RATE * event.duration_ms / 1000)
-        if num_samples == 0:
-            return b""
-
-        samples: List[int] = []
-        for i in range(num_samples):
-            t = i / SAMPLE_RATE
-
-            # Base pitch with optional vibrato (5 Hz LFO, +-10 Hz)
-            freq = event.pitch_hz
-            if event.vibrato:
-                freq += 10.0 * math.sin(2 * math.pi * 5.0 * t)
-
-            # Generate sine wave for fundamental
-            value = math.sin(2 * math.pi * freq * t)
-
-            # Add harmony intervals (each interval is semitone offset)
-            for interval in event.harmony_intervals:
-                harmony_freq = freq * (2 ** (interval / 12.0))
-                value += 0.5 * math.sin(2 * math.pi * harmony_freq * t)
-
-            # Normalize if harmonies added
-            if event.harmony_intervals:
-                value /= 1.0 + 0.5 * len(event.harmony_intervals)
-
-            # Apply volume
-            value *= event.volume
-
-            # Convert to 16-bit integer
-            sample = int(value * 32767)
-            sample = max(-32768, min(32767, sample))
-            samples.append(sample)
-
-        return struct.pack(f"<{len(samples)}h", *samples)
+        # The phoneme label and start time do not affect the waveform, so
+        # repeated notes share one cached PCM buffer.
+        return _synth_cached(
+            event.pitch_hz,
+            event.duration_ms,
+            event.volume,
+            event.vibrato,
+            tuple(event.harmony_intervals),
+        )
 
     def play(self, audio_data: bytes) -> None:
         """No-op for testing -- does not produce actual audio output."""
@@ -88,3 +68,62 @@ class CoquiSynthesizer(AudioSynthesizer):
 
     def play(self, audio_data: bytes) -> None:
         raise NotImplementedError("Coqui TTS integration pending")
+
+
+@functools.lru_cache(maxsize=512)
+def _synth_cached(
+    pitch_hz: float,
+    duration_ms: int,
+    volume: float,
+    vibrato: bool,
+    harmony_intervals: Tuple[int, ...],
+) -> bytes:
+    """Render one sine-wave note as 16-bit PCM, memoized on its parameters.
+
+    The returned bytes are immutable, so cached results are safe to share.
+    """
+    num_samples = int(SAMPLE_RATE * duration_ms / 1000)
+    if num_samples == 0:
+        return b""
+
+    # Every normalized sample is within [-1, 1], so below one LSB of volume
+    # the whole note truncates to silence; skip generating it
+    if abs(volume) * 32767 < 1.0:
+        return bytes(num_samples * SAMPLE_WIDTH)
+
+    # Build each stage as a whole-array pass (comprehension/map) rather
+    # than one interpreted loop iteration per sample.
+    two_pi = 2 * math.pi
+    times = [i / SAMPLE_RATE for i in range(num_samples)]
+
+    # Base pitch with optional vibrato (5 Hz LFO, +-10 Hz)
+    if vibrato:
+        lfo = two_pi * 5.0
+        phases = [two_pi * (pitch_hz + 10.0 * math.sin(lfo * t)) * t for t in times]
+    else:
+        step = two_pi * pitch_hz
+        phases = [step * t for t in times]
+
+    # Generate sine wave for fundamental
+    values = list(map(math.sin, phases))
+
+    # Add harmony intervals (each interval is semitone offset). A harmony
+    # at freq * ratio has phase * ratio, so it reuses the fundamental phase.
+    for interval in harmony_intervals:
+        ratio = 2 ** (interval / 12.0)
+        values = [v + 0.5 * math.sin(ph * ratio) for v, ph in zip(values, phases)]
+
+    # Normalize (if harmonies added), apply volume and scale to 16-bit in a
+    # single multiply per sample
+    scale = volume * 32767
+    if harmony_intervals:
+        scale /= 1.0 + 0.5 * len(harmony_intervals)
+
+    samples = array.array("h", [
+        max(-32768, min(32767, int(v * scale))) for v in values
+    ])
+
+    # Pack the typed array in one copy (no num_samples-long argument tuple)
+    if _BIG_ENDIAN:
+        samples.byteswap()
+    return samples.tobytes()
@@ -1,10 +1,11 @@
 """Difficulty system -- configurable difficulty levels that adjust gameplay parameters."""
 
 from dataclasses import dataclass
-from typing import Dict
+from types import MappingProxyType
+from typing import Mapping
 
 
-@dataclass
+@dataclass(frozen=True)
 class DifficultySettings:
     """Gameplay parameters that vary by difficulty level.
 
@@ -92,12 +93,16 @@ EXPERT = DifficultySettings(
     description="Razor-thin buffer zone. Only for virtuosos.",
 )
 
-DIFFICULTY_PRESETS: Dict[str, DifficultySettings] = {
+# Read-only view: presets are shared by every pipeline, so they must not
+# be replaced or mutated at runtime
+DIFFICULTY_PRESETS: Mapping[str, DifficultySettings] = MappingProxyType({
     "easy": EASY,
     "medium": MEDIUM,
     "hard": HARD,
     "expert": EXPERT,
-}
+})
+
+_VALID_DIFFICULTIES = ", ".join(sorted(DIFFICULTY_PRESETS))
 
 
 def get_difficulty(name: str) -> DifficultySettings:
@@ -106,11 +111,10 @@ def get_difficulty(name: str) -> DifficultySettings:
     Raises:
         KeyError: If the difficulty name is not recognized.
     """
-    key = name.lower()
-    if key not in DIFFICULTY_PRESETS:
-        valid = ", ".join(sorted(DIFFICULTY_PRESETS))
-        raise KeyError(f"Unknown difficulty {name!r}. Valid: {valid}")
-    return DIFFICULTY_PRESETS[key]
+    settings = DIFFICULTY_PRESETS.get(name.lower())
+    if settings is None:
+        raise KeyError(f"Unknown difficulty {name!r}. Valid: {_VALID_DIFFICULTIES}")
+    return settings
 
 
 def list_difficulties() -> list:
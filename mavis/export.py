@@ -12,16 +12,18 @@ uses the SDK's MavisBridge and validator. When absent, it generates compatible
 output directly using the IML spec's tag structure.
 """
 
-import json
+import io
 import os
 import uuid
 from dataclasses import dataclass, field
+from operator import attrgetter
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from mavis.llm_processor import PhonemeEvent
 from mavis.output_buffer import BufferState
 from mavis.sheet_text import SheetTextToken
+from mavis.storage import json_dumps_bytes
 
 # IML version this module targets
 IML_VERSION = "1.0.0"
@@ -34,6 +36,13 @@ _EMPHASIS_TO_IML = {
     "shout": {"volume": "+12dB", "pitch": "+20%", "quality": "tense"},
 }
 
+# Emphasis -> joined IML prosody attribute string, built once at import
+_EMPHASIS_TO_ATTR_STR = {
+    emphasis: " ".join(f'{k}="{v}"' for k, v in attrs.items())
+    for emphasis, attrs in _EMPHASIS_TO_IML.items()
+    if attrs
+}
+
 # Emphasis -> IML emphasis level mapping
 _EMPHASIS_TO_LEVEL = {
     "soft": "reduced",
@@ -41,6 +50,19 @@ _EMPHASIS_TO_LEVEL = {
     "shout": "strong",
 }
 
+# Single-pass XML escaping table for _escape_xml
+_XML_ESCAPE_TABLE = str.maketrans({
+    "&": "&amp;",
+    "<": "&lt;",
+    ">": "&gt;",
+    '"': "&quot;",
+})
+
+# PhonemeEvent field getters for C-level sum(map(...)) aggregation
+_VOLUME = attrgetter("volume")
+_PITCH = attrgetter("pitch_hz")
+_BREATHINESS = attrgetter("breathiness")
+
 # Volume-based emotion inference thresholds
 _HIGH_VOLUME = 0.7
 _LOW_VOLUME = 0.35
@@ -57,6 +79,13 @@ class PerformanceEvent:
     event_type: str  # "keystroke" | "token" | "phoneme" | "buffer_state"
     data: Dict[str, Any] = field(default_factory=dict)
 
+    def to_dict(self) -> dict:
+        return {
+            "time_ms": self.time_ms,
+            "event_type": self.event_type,
+            "data": self.data,
+        }
+
 
 @dataclass
 class PerformanceRecording:
@@ -77,6 +106,48 @@ class PerformanceRecording:
     grade: str = "F"
     consent: bool = False
 
+    def to_dict(self) -> dict:
+        """Flatten the recording into plain dicts and lists.
+
+        Same shape as ``dataclasses.asdict`` but built directly, without
+        its recursive deep copy of every nested field.
+        """
+        return {
+            "session_id": self.session_id,
+            "timestamp": self.timestamp,
+            "song_id": self.song_id,
+            "transcript": self.transcript,
+            "hardware_profile": self.hardware_profile,
+            "difficulty": self.difficulty,
+            "events": [e.to_dict() for e in self.events],
+            "tokens": [
+                {
+                    "text": t.text,
+                    "emphasis": t.emphasis,
+                    "sustain": t.sustain,
+                    "harmony": t.harmony,
+                    "duration_modifier": t.duration_modifier,
+                }
+                for t in self.tokens
+            ],
+            "phoneme_events": [
+                {
+                    "phoneme": e.phoneme,
+                    "start_ms": e.start_ms,
+                    "duration_ms": e.duration_ms,
+                    "volume": e.volume,
+                    "pitch_hz": e.pitch_hz,
+                    "vibrato": e.vibrato,
+                    "breathiness": e.breathiness,
+                    "harmony_intervals": list(e.harmony_intervals),
+                }
+                for e in self.phoneme_events
+            ],
+            "score": self.score,
+            "grade": self.grade,
+            "consent": self.consent,
+        }
+
     def record_keystroke(self, time_ms: int, char: str, modifiers: Dict[str, bool]) -> None:
         """Record a keystroke event."""
         self.events.append(PerformanceEvent(
@@ -141,10 +212,37 @@ def infer_emotion(phoneme_events: List[PhonemeEvent]) -> str:
     if not phoneme_events:
         return "neutral"
 
-    mean_vol = sum(e.volume for e in phoneme_events) / len(phoneme_events)
-    mean_pitch = sum(e.pitch_hz for e in phoneme_events) / len(phoneme_events)
-    mean_breath = sum(e.breathiness for e in phoneme_events) / len(phoneme_events)
+    # Same decisions as _emotion_from_means(), but each mean is computed only
+    # once a branch needs it: loud sessions never need breathiness, and the
+    # rest never need pitch.
+    n = len(phoneme_events)
+    mean_vol = sum(map(_VOLUME, phoneme_events)) / n
+    if mean_vol > _HIGH_VOLUME:
+        mean_pitch = sum(map(_PITCH, phoneme_events)) / n
+        return "angry" if mean_pitch > _HIGH_PITCH_HZ else "joyful"
+    if sum(map(_BREATHINESS, phoneme_events)) / n > _HIGH_BREATHINESS:
+        return "sad"
+    if mean_vol < _LOW_VOLUME:
+        return "calm"
+    return "neutral"
+
+
+def _prosody_means(phoneme_events: List[PhonemeEvent]) -> Tuple[float, float, float]:
+    """Return (mean_volume, mean_pitch_hz, mean_breathiness) in a single pass.
+
+    ``phoneme_events`` must be non-empty.
+    """
+    vol_sum = pitch_sum = breath_sum = 0.0
+    for e in phoneme_events:
+        vol_sum += e.volume
+        pitch_sum += e.pitch_hz
+        breath_sum += e.breathiness
+    n = len(phoneme_events)
+    return vol_sum / n, pitch_sum / n, breath_sum / n
 
+
+def _emotion_from_means(mean_vol: float, mean_pitch: float, mean_breath: float) -> str:
+    """Classify precomputed session means with the infer_emotion() heuristic."""
     if mean_vol > _HIGH_VOLUME and mean_pitch > _HIGH_PITCH_HZ:
         return "angry"
     if mean_vol > _HIGH_VOLUME and mean_pitch <= _HIGH_PITCH_HZ:
@@ -156,6 +254,38 @@ def infer_emotion(phoneme_events: List[PhonemeEvent]) -> str:
     return "neutral"
 
 
+def emotion_from_features(features: List[float]) -> str:
+    """Apply the infer_emotion() heuristic to an extract_training_features() vector.
+
+    Lets callers that already hold the feature vector classify the emotion
+    without another pass over the phoneme events.
+    """
+    return _emotion_from_means(features[2], features[0], features[4])
+
+
+def _token_wrap(emphasis: str) -> Tuple[str, str]:
+    """Return the (opening, closing) markup around a token line's text."""
+    open_tag = close_tag = ""
+    level = _EMPHASIS_TO_LEVEL.get(emphasis)
+    if level is not None:
+        open_tag, close_tag = f'<emphasis level="{level}">', "</emphasis>"
+    attr_str = _EMPHASIS_TO_ATTR_STR.get(emphasis)
+    if attr_str is not None:
+        # Nest <emphasis> inside <prosody> so text appears only once
+        open_tag = f"<prosody {attr_str}>{open_tag}"
+        close_tag = f"{close_tag}</prosody>"
+    return f"\n    {open_tag}", close_tag
+
+
+# Token line markup per emphasis, built once at import so tokens_to_iml
+# only concatenates; unannotated text uses _PLAIN_WRAP
+_TOKEN_WRAP = {
+    emphasis: _token_wrap(emphasis)
+    for emphasis in {*_EMPHASIS_TO_ATTR_STR, *_EMPHASIS_TO_LEVEL}
+}
+_PLAIN_WRAP = _token_wrap("none")
+
+
 def tokens_to_iml(tokens: List[SheetTextToken], language: str = "en-US") -> str:
     """Convert Sheet Text tokens into an IML XML document string.
 
@@ -166,45 +296,27 @@ def tokens_to_iml(tokens: List[SheetTextToken], language: str = "en-US") -> str:
     - <emphasis> for emphasis levels
     - <pause> for sustain markers
     """
-    parts = []
-    parts.append(
+    # Lines are streamed into one buffer, each after a "\n" separator
+    out = io.StringIO()
+    write = out.write
+    write(
         f'<iml version="{IML_VERSION}" language="{language}" '
         f'consent="explicit" processing="local">'
     )
-    parts.append('  <utterance emotion="neutral" confidence="0.5">')
+    write('\n  <utterance emotion="neutral" confidence="0.5">')
 
     for token in tokens:
         text = _escape_xml(token.text)
 
-        has_prosody = token.emphasis in _EMPHASIS_TO_IML and token.emphasis != "none"
-        has_emphasis = token.emphasis in _EMPHASIS_TO_LEVEL
-
-        if has_prosody:
-            attrs = _EMPHASIS_TO_IML[token.emphasis]
-            attr_str = " ".join(f'{k}="{v}"' for k, v in attrs.items())
-            if has_emphasis:
-                level = _EMPHASIS_TO_LEVEL[token.emphasis]
-                # Nest <emphasis> inside <prosody> so text appears only once
-                parts.append(
-                    f'    <prosody {attr_str}>'
-                    f'<emphasis level="{level}">{text}</emphasis>'
-                    f"</prosody>"
-                )
-            else:
-                parts.append(f"    <prosody {attr_str}>{text}</prosody>")
-        elif has_emphasis:
-            level = _EMPHASIS_TO_LEVEL[token.emphasis]
-            parts.append(f'    <emphasis level="{level}">{text}</emphasis>')
-        else:
-            parts.append(f"    {text}")
+        open_tag, close_tag = _TOKEN_WRAP.get(token.emphasis, _PLAIN_WRAP)
+        write(open_tag + text + close_tag)
 
         if token.sustain:
             duration_ms = int(token.duration_modifier * 400)
-            parts.append(f'    <pause duration="{duration_ms}"/>')
+            write(f'\n    <pause duration="{duration_ms}"/>')
 
-    parts.append("  </utterance>")
-    parts.append("</iml>")
-    return "\n".join(parts)
+    write("\n  </utterance>\n</iml>")
+    return out.getvalue()
 
 
 def phoneme_events_to_iml(
@@ -218,37 +330,55 @@ def phoneme_events_to_iml(
     from the session mean and wraps words with significant deviation in
     <prosody> tags. Compatible with Prosody-Protocol MavisBridge output.
     """
+    return _phoneme_iml_and_emotion(phoneme_events, transcript, language)[0]
+
+
+def _phoneme_iml_and_emotion(
+    phoneme_events: List[PhonemeEvent],
+    transcript: str,
+    language: str,
+) -> Tuple[str, str]:
+    """Build the phoneme_events_to_iml() document and return it with the emotion.
+
+    The emotion is the infer_emotion() label, derived from the same session
+    means the document needs, so callers wanting both skip a second pass.
+    """
     if not phoneme_events:
-        return f'<iml version="{IML_VERSION}" language="{language}"></iml>'
+        return f'<iml version="{IML_VERSION}" language="{language}"></iml>', "neutral"
 
-    mean_pitch = sum(e.pitch_hz for e in phoneme_events) / len(phoneme_events)
-    mean_vol = sum(e.volume for e in phoneme_events) / len(phoneme_events)
-    emotion = infer_emotion(phoneme_events)
+    # One pass for the session means, shared with the emotion heuristic
+    mean_vol, mean_pitch, mean_breath = _prosody_means(phoneme_events)
+    emotion = _emotion_from_means(mean_vol, mean_pitch, mean_breath)
 
     words = transcript.split() if transcript else [e.phoneme for e in phoneme_events]
 
-    parts = []
-    parts.append(
+    out = io.StringIO()
+    write = out.write
+    write(
         f'<iml version="{IML_VERSION}" language="{language}" '
         f'consent="explicit" processing="local">'
     )
 
     confidence = min(1.0, abs(mean_vol - 0.5) + abs(mean_pitch - 220.0) / 220.0)
-    parts.append(f'  <utterance emotion="{emotion}" confidence="{confidence:.2f}">')
+    write(f'\n  <utterance emotion="{emotion}" confidence="{confidence:.2f}">')
 
     # Distribute phonemes across words roughly
-    ph_per_word = max(1, len(phoneme_events) // max(1, len(words)))
-    idx = 0
-    for word in words:
-        word_phonemes = phoneme_events[idx: idx + ph_per_word]
-        idx += ph_per_word
-
-        if not word_phonemes:
-            parts.append(f"    {_escape_xml(word)}")
+    n_events = len(phoneme_events)
+    ph_per_word = max(1, n_events // max(1, len(words)))
+    # Pull the per-event fields out once so each word's means are C-level
+    # sums over list slices rather than generator passes over attributes
+    pitches = [e.pitch_hz for e in phoneme_events]
+    volumes = [e.volume for e in phoneme_events]
+    for word_idx, word in enumerate(words):
+        start = word_idx * ph_per_word
+        if start >= n_events:
+            write(f"\n    {_escape_xml(word)}")
             continue
+        end = min(start + ph_per_word, n_events)
+        count = end - start
 
-        w_pitch = sum(e.pitch_hz for e in word_phonemes) / len(word_phonemes)
-        w_vol = sum(e.volume for e in word_phonemes) / len(word_phonemes)
+        w_pitch = sum(pitches[start:end]) / count
+        w_vol = sum(volumes[start:end]) / count
 
         pitch_dev = (w_pitch - mean_pitch) / mean_pitch if mean_pitch > 0 else 0
         vol_dev = w_vol - mean_vol
@@ -257,16 +387,15 @@ def phoneme_events_to_iml(
             pitch_pct = f"{pitch_dev:+.0%}"
             vol_db = f"{vol_dev * 20:+.0f}dB"
             attrs = f'pitch="{pitch_pct}" volume="{vol_db}"'
-            any_breathy = any(e.breathiness > 0.3 for e in word_phonemes)
+            any_breathy = any(e.breathiness > 0.3 for e in phoneme_events[start:end])
             if any_breathy:
                 attrs += ' quality="breathy"'
-            parts.append(f"    <prosody {attrs}>{_escape_xml(word)}</prosody>")
+            write(f"\n    <prosody {attrs}>{_escape_xml(word)}</prosody>")
         else:
-            parts.append(f"    {_escape_xml(word)}")
+            write(f"\n    {_escape_xml(word)}")
 
-    parts.append("  </utterance>")
-    parts.append("</iml>")
-    return "\n".join(parts)
+    write("\n  </utterance>\n</iml>")
+    return out.getvalue(), emotion
 
 
 def recording_to_dataset_entry(recording: PerformanceRecording) -> Dict[str, Any]:
@@ -275,11 +404,11 @@ def recording_to_dataset_entry(recording: PerformanceRecording) -> Dict[str, Any
     Output conforms to schemas/dataset-entry.schema.json in the
     Prosody-Protocol repo.
     """
-    iml = phoneme_events_to_iml(
+    iml, emotion = _phoneme_iml_and_emotion(
         recording.phoneme_events,
-        transcript=recording.transcript,
+        recording.transcript,
+        "en-US",
     )
-    emotion = infer_emotion(recording.phoneme_events)
 
     return {
         "id": f"mavis_{recording.session_id}",
@@ -318,22 +447,42 @@ def extract_training_features(phoneme_events: List[PhonemeEvent]) -> List[float]
     if not phoneme_events:
         return [0.0] * 7
 
-    pitches = [e.pitch_hz for e in phoneme_events]
-    volumes = [e.volume for e in phoneme_events]
-    breaths = [e.breathiness for e in phoneme_events]
-
-    total_duration_s = sum(e.duration_ms for e in phoneme_events) / 1000.0
-    speech_rate = len(phoneme_events) / total_duration_s if total_duration_s > 0 else 0.0
-    vibrato_ratio = sum(1 for e in phoneme_events if e.vibrato) / len(phoneme_events)
+    # One pass with local accumulators; no per-field intermediate lists
+    n = len(phoneme_events)
+    pitch_sum = vol_sum = breath_sum = 0.0
+    min_pitch = max_pitch = phoneme_events[0].pitch_hz
+    min_vol = max_vol = phoneme_events[0].volume
+    total_duration_ms = 0
+    vibrato_count = 0
+    for e in phoneme_events:
+        pitch = e.pitch_hz
+        vol = e.volume
+        pitch_sum += pitch
+        vol_sum += vol
+        breath_sum += e.breathiness
+        if pitch < min_pitch:
+            min_pitch = pitch
+        elif pitch > max_pitch:
+            max_pitch = pitch
+        if vol < min_vol:
+            min_vol = vol
+        elif vol > max_vol:
+            max_vol = vol
+        total_duration_ms += e.duration_ms
+        if e.vibrato:
+            vibrato_count += 1
+
+    total_duration_s = total_duration_ms / 1000.0
+    speech_rate = n / total_duration_s if total_duration_s > 0 else 0.0
 
     return [
-        sum(pitches) / len(pitches),       # mean_pitch_hz
-        max(pitches) - min(pitches),        # pitch_range_hz
-        sum(volumes) / len(volumes),        # mean_volume
-        max(volumes) - min(volumes),        # volume_range
-        sum(breaths) / len(breaths),        # mean_breathiness
-        speech_rate,                        # speech_rate
-        vibrato_ratio,                      # vibrato_ratio
+        pitch_sum / n,              # mean_pitch_hz
+        max_pitch - min_pitch,      # pitch_range_hz
+        vol_sum / n,                # mean_volume
+        max_vol - min_vol,          # volume_range
+        breath_sum / n,             # mean_breathiness
+        speech_rate,                # speech_rate
+        vibrato_count / n,          # vibrato_ratio
     ]
 
 
@@ -341,8 +490,7 @@ def export_performance(recording: PerformanceRecording, path: str) -> None:
     """Write a single performance recording as a dataset entry JSON file."""
     entry = recording_to_dataset_entry(recording)
     os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
-    with open(path, "w") as f:
-        json.dump(entry, f, indent=2)
+    _write_json(path, entry)
 
 
 def export_dataset(
@@ -374,23 +522,27 @@ def export_dataset(
         "created": datetime.now(timezone.utc).isoformat(),
     }
 
-    with open(os.path.join(output_dir, "metadata.json"), "w") as f:
-        json.dump(metadata, f, indent=2)
+    _write_json(os.path.join(output_dir, "metadata.json"), metadata)
 
     for i, rec in enumerate(recordings):
         entry = recording_to_dataset_entry(rec)
         entry_path = os.path.join(entries_dir, f"mavis_session_{i + 1:03d}.json")
-        with open(entry_path, "w") as f:
-            json.dump(entry, f, indent=2)
+        _write_json(entry_path, entry)
 
     return output_dir
 
 
+def _write_json(path: str, data: Dict[str, Any]) -> None:
+    """Write ``data`` as indented JSON with a single write() call.
+
+    Encodes to one buffer first, through orjson when it is installed, rather
+    than streaming each encoder chunk through its own write().
+    """
+    payload = json_dumps_bytes(data, pretty=True)
+    with open(path, "wb") as f:
+        f.write(payload)
+
+
 def _escape_xml(text: str) -> str:
     """Escape special XML characters."""
-    return (
-        text.replace("&", "&amp;")
-        .replace("<", "&lt;")
-        .replace(">", "&gt;")
-        .replace('"', "&quot;")
-    )
+    return text.translate(_XML_ESCAPE_TABLE)
@@ -2,13 +2,15 @@
 
 import time
 from collections import deque
+from itertools import islice
 from typing import Dict, List, Optional
 
 
 class InputBuffer:
     """FIFO queue for keyboard input that feeds into the Sheet Text parser.
 
-    Each buffered item stores the character, modifier key state, and timestamp.
+    Each buffered item stores the character, modifier key state, and a
+    monotonic timestamp in milliseconds (only meaningful relative to others).
     When the buffer exceeds capacity, the oldest items are silently dropped.
     """
 
@@ -24,21 +26,26 @@ class InputBuffer:
             "shift": mods.get("shift", False),
             "ctrl": mods.get("ctrl", False),
             "alt": mods.get("alt", False),
-            "timestamp_ms": int(time.time() * 1000),
+            # Monotonic integer clock: no float math, never steps backwards
+            "timestamp_ms": time.monotonic_ns() // 1_000_000,
         }
         self._buffer.append(item)
 
     def peek(self, n: int) -> List[Dict]:
         """Look at the next N characters without consuming them."""
-        items = list(self._buffer)
-        return items[:n]
+        # islice stops after n items instead of copying the whole buffer
+        return list(islice(self._buffer, max(n, 0)))
 
     def consume(self, n: int) -> List[Dict]:
         """Remove and return the next N characters from the buffer."""
-        result = []
-        for _ in range(min(n, len(self._buffer))):
-            result.append(self._buffer.popleft())
-        return result
+        buf = self._buffer
+        if n >= len(buf):
+            # Taking everything: copy in one go, then empty the deque
+            result = list(buf)
+            buf.clear()
+            return result
+        popleft = buf.popleft
+        return [popleft() for _ in range(n)]
 
     def level(self) -> float:
         """Return buffer fill ratio (0.0 = empty, 1.0 = full)."""
@@ -1,14 +1,20 @@
 """Leaderboard -- local JSON-based high score storage."""
 
+import atexit
 import json
 import os
-from dataclasses import asdict, dataclass, field
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from mavis.storage import atomic_json_save, locked_json_load
 
 
+# Parsed "songs" data per leaderboard file, with the (mtime_ns, size) it was
+# read at
+_PARSE_CACHE: Dict[str, Tuple[Tuple[int, int], Dict[str, List[dict]]]] = {}
+
+
 @dataclass
 class LeaderboardEntry:
     """A single leaderboard entry."""
@@ -23,56 +29,116 @@ class LeaderboardEntry:
         default_factory=lambda: datetime.now(timezone.utc).isoformat()
     )
 
+    def to_dict(self) -> dict:
+        return {
+            "player_name": self.player_name,
+            "score": self.score,
+            "grade": self.grade,
+            "song_id": self.song_id,
+            "difficulty": self.difficulty,
+            "accuracy": self.accuracy,
+            "timestamp": self.timestamp,
+        }
+
 
 @dataclass
 class Leaderboard:
     """In-memory leaderboard backed by a JSON file.
 
     Stores per-song high scores with a configurable maximum entries per song.
+
+    By default every change is written to disk immediately. With
+    ``flush_every_n`` > 1, changes are written once per that many changes,
+    on ``flush()``, and at interpreter exit; a crash can lose up to
+    ``flush_every_n - 1`` unwritten changes.
     """
 
     path: str
     max_entries_per_song: int = 10
+    flush_every_n: int = 1
     _entries: Dict[str, List[dict]] = field(default_factory=dict, repr=False)
+    _pending: int = field(default=0, repr=False)
+    # song_id -> difficulty -> that song's entries at that difficulty, in
+    # rank order; built on first query, dropped when the song changes
+    _by_difficulty: Dict[str, Dict[str, List[dict]]] = field(
+        default_factory=dict, repr=False
+    )
 
     def __post_init__(self) -> None:
         self._load()
+        if self.flush_every_n > 1:
+            atexit.register(self.flush)
 
     def _load(self) -> None:
-        """Load entries from the JSON file if it exists."""
-        data = locked_json_load(self.path)
-        self._entries = data.get("songs", {}) if data else {}
+        """Load entries from the JSON file if it exists.
+
+        Reuses the last parse of the same file while its mtime and size are
+        unchanged, so repeated construction costs a stat() plus a copy.
+        """
+        key = os.path.abspath(self.path)
+        try:
+            st = os.stat(self.path)
+            signature: Optional[Tuple[int, int]] = (st.st_mtime_ns, st.st_size)
+        except OSError:
+            signature = None
+
+        cached = _PARSE_CACHE.get(key)
+        if signature is not None and cached is not None and cached[0] == signature:
+            songs = cached[1]
+        else:
+            data = locked_json_load(self.path)
+            songs = data.get("songs", {}) if data else {}
+            # submit() relies on each song's list being sorted; files written
+            # by _save() already are, so this is a cheap check-and-keep pass
+            for entries in songs.values():
+                entries.sort(key=_score_key, reverse=True)
+            if signature is not None:
+                _PARSE_CACHE[key] = (signature, songs)
+
+        self._by_difficulty = {}
+        # Private copy: this instance mutates its lists and callers receive
+        # the entry dicts, neither of which may leak into the shared cache
+        self._entries = {
+            song_id: [dict(e) for e in entries] for song_id, entries in songs.items()
+        }
 
     def _save(self) -> None:
         """Persist entries to the JSON file (atomic write with file lock)."""
         atomic_json_save(self.path, {"songs": self._entries})
 
+    def _changed(self) -> None:
+        """Count one change and write to disk once enough are pending."""
+        self._pending += 1
+        if self._pending >= self.flush_every_n:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write any pending changes to disk."""
+        if self._pending:
+            self._save()
+            self._pending = 0
+
     def submit(self, entry: LeaderboardEntry) -> int:
         """Submit a score and return its rank (1-based) within that song.
 
         Returns 0 if the score did not make the leaderboard.
         """
-        song_key = entry.song_id
-        entries = self._entries.setdefault(song_key, [])
-        new = asdict(entry)
-
-        entries.append(new)
-        entries.sort(key=lambda e: e["score"], reverse=True)
-
-        if len(entries) > self.max_entries_per_song:
-            entries[:] = entries[: self.max_entries_per_song]
-
-        self._save()
-
-        # Determine rank
-        for i, e in enumerate(entries):
-            if (
-                e["score"] == new["score"]
-                and e["timestamp"] == new["timestamp"]
-                and e["player_name"] == new["player_name"]
-            ):
-                return i + 1
-        return 0
+        entries = self._entries.setdefault(entry.song_id, [])
+
+        # Entries are kept sorted by descending score, so the new one goes
+        # after every entry scoring at least as much (ties keep submission
+        # order) and that position is its rank.
+        idx = _insertion_index(entries, entry.score)
+        if idx >= self.max_entries_per_song:
+            # Fell straight off a full board: stored data is unchanged, so
+            # there is nothing to rewrite on disk.
+            return 0
+
+        entries.insert(idx, entry.to_dict())
+        del entries[self.max_entries_per_song:]
+        self._by_difficulty.pop(entry.song_id, None)
+        self._changed()
+        return idx + 1
 
     def get_scores(
         self,
@@ -81,9 +147,17 @@ class Leaderboard:
         limit: int = 10,
     ) -> List[dict]:
         """Return top scores for a song, optionally filtered by difficulty."""
-        entries = self._entries.get(song_id, [])
+        entries = self._entries.get(song_id)
+        if not entries:
+            return []
         if difficulty is not None:
-            entries = [e for e in entries if e.get("difficulty") == difficulty]
+            views = self._by_difficulty.setdefault(song_id, {})
+            view = views.get(difficulty)
+            if view is None:
+                view = views[difficulty] = [
+                    e for e in entries if e.get("difficulty") == difficulty
+                ]
+            entries = view
         return entries[:limit]
 
     def get_all_scores(self, limit_per_song: int = 5) -> Dict[str, List[dict]]:
@@ -97,9 +171,11 @@ class Leaderboard:
         """Clear scores for a specific song, or all scores."""
         if song_id is not None:
             self._entries.pop(song_id, None)
+            self._by_difficulty.pop(song_id, None)
         else:
             self._entries.clear()
-        self._save()
+            self._by_difficulty.clear()
+        self._changed()
 
     def format_scores(self, song_id: str, limit: int = 10) -> str:
         """Format a song's leaderboard for terminal display."""
@@ -116,6 +192,25 @@ class Leaderboard:
         return "\n".join(lines)
 
 
+def _score_key(entry: dict) -> int:
+    return entry["score"]
+
+
+def _insertion_index(entries: List[dict], score: int) -> int:
+    """Binary-search the slot for ``score`` in a descending-score list.
+
+    Returns the index just past the last entry scoring ``score`` or more.
+    """
+    lo, hi = 0, len(entries)
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if entries[mid]["score"] >= score:
+            lo = mid + 1
+        else:
+            hi = mid
+    return lo
+
+
 def get_default_leaderboard() -> Leaderboard:
     """Return a Leaderboard using the default path (~/.mavis/leaderboards.json)."""
     home = os.path.expanduser("~")
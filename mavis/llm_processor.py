@@ -2,7 +2,7 @@
 
 import abc
 from dataclasses import dataclass, field
-from typing import List
+from typing import List, Tuple
 
 from mavis.sheet_text import SheetTextToken
 
@@ -29,73 +29,78 @@ class LLMProcessor(abc.ABC):
         """Convert Sheet Text tokens into a list of PhonemeEvents."""
 
 
-# Basic English-to-phoneme lookup (simplified ARPAbet-style, ~60 common words)
+# Basic English-to-phoneme lookup (simplified ARPAbet-style, ~60 common words).
+# Values are tuples so lookups can be returned directly without copying.
 _WORD_PHONEMES = {
-    "the": ["dh", "ax"],
-    "a": ["ax"],
-    "an": ["ae", "n"],
-    "and": ["ae", "n", "d"],
-    "is": ["ih", "z"],
-    "are": ["aa", "r"],
-    "was": ["w", "aa", "z"],
-    "i": ["ay"],
-    "you": ["y", "uw"],
-    "it": ["ih", "t"],
-    "in": ["ih", "n"],
-    "to": ["t", "uw"],
-    "of": ["ah", "v"],
-    "for": ["f", "ao", "r"],
-    "on": ["aa", "n"],
-    "with": ["w", "ih", "th"],
-    "this": ["dh", "ih", "s"],
-    "that": ["dh", "ae", "t"],
-    "not": ["n", "aa", "t"],
-    "but": ["b", "ah", "t"],
-    "my": ["m", "ay"],
-    "all": ["ao", "l"],
-    "so": ["s", "ow"],
-    "up": ["ah", "p"],
-    "sun": ["s", "ah", "n"],
-    "rising": ["r", "ay", "z", "ih", "ng"],
-    "rises": ["r", "ay", "z", "ih", "z"],
-    "falling": ["f", "ao", "l", "ih", "ng"],
-    "down": ["d", "aw", "n"],
-    "hold": ["hh", "ow", "l", "d"],
-    "note": ["n", "ow", "t"],
-    "singing": ["s", "ih", "ng", "ih", "ng"],
-    "together": ["t", "ax", "g", "eh", "dh", "er"],
-    "again": ["ax", "g", "eh", "n"],
-    "hello": ["hh", "ax", "l", "ow"],
-    "world": ["w", "er", "l", "d"],
-    "gently": ["jh", "eh", "n", "t", "l", "iy"],
-    "said": ["s", "eh", "d"],
-    "stop": ["s", "t", "aa", "p"],
-    "twinkle": ["t", "w", "ih", "ng", "k", "ax", "l"],
-    "little": ["l", "ih", "t", "ax", "l"],
-    "star": ["s", "t", "aa", "r"],
-    "how": ["hh", "aw"],
-    "wonder": ["w", "ah", "n", "d", "er"],
-    "what": ["w", "ah", "t"],
-    "above": ["ax", "b", "ah", "v"],
-    "like": ["l", "ay", "k"],
-    "diamond": ["d", "ay", "ax", "m", "ax", "n", "d"],
-    "sky": ["s", "k", "ay"],
+    "the": ("dh", "ax"),
+    "a": ("ax",),
+    "an": ("ae", "n"),
+    "and": ("ae", "n", "d"),
+    "is": ("ih", "z"),
+    "are": ("aa", "r"),
+    "was": ("w", "aa", "z"),
+    "i": ("ay",),
+    "you": ("y", "uw"),
+    "it": ("ih", "t"),
+    "in": ("ih", "n"),
+    "to": ("t", "uw"),
+    "of": ("ah", "v"),
+    "for": ("f", "ao", "r"),
+    "on": ("aa", "n"),
+    "with": ("w", "ih", "th"),
+    "this": ("dh", "ih", "s"),
+    "that": ("dh", "ae", "t"),
+    "not": ("n", "aa", "t"),
+    "but": ("b", "ah", "t"),
+    "my": ("m", "ay"),
+    "all": ("ao", "l"),
+    "so": ("s", "ow"),
+    "up": ("ah", "p"),
+    "sun": ("s", "ah", "n"),
+    "rising": ("r", "ay", "z", "ih", "ng"),
+    "rises": ("r", "ay", "z", "ih", "z"),
+    "falling": ("f", "ao", "l", "ih", "ng"),
+    "down": ("d", "aw", "n"),
+    "hold": ("hh", "ow", "l", "d"),
+    "note": ("n", "ow", "t"),
+    "singing": ("s", "ih", "ng", "ih", "ng"),
+    "together": ("t", "ax", "g", "eh", "dh", "er"),
+    "again": ("ax", "g", "eh", "n"),
+    "hello": ("hh", "ax", "l", "ow"),
+    "world": ("w", "er", "l", "d"),
+    "gently": ("jh", "eh", "n", "t", "l", "iy"),
+    "said": ("s", "eh", "d"),
+    "stop": ("s", "t", "aa", "p"),
+    "twinkle": ("t", "w", "ih", "ng", "k", "ax", "l"),
+    "little": ("l", "ih", "t", "ax", "l"),
+    "star": ("s", "t", "aa", "r"),
+    "how": ("hh", "aw"),
+    "wonder": ("w", "ah", "n", "d", "er"),
+    "what": ("w", "ah", "t"),
+    "above": ("ax", "b", "ah", "v"),
+    "like": ("l", "ay", "k"),
+    "diamond": ("d", "ay", "ax", "m", "ax", "n", "d"),
+    "sky": ("s", "k", "ay"),
 }
 
 
-def _word_to_phonemes(word: str) -> List[str]:
+def _word_to_phonemes(word: str) -> Tuple[str, ...]:
     """Look up phonemes for a word, falling back to letter-by-letter."""
-    key = word.lower()
-    if key in _WORD_PHONEMES:
-        return list(_WORD_PHONEMES[key])
+    phonemes = _WORD_PHONEMES.get(word.lower())
+    if phonemes is not None:
+        return phonemes
     # Fallback: one phoneme per letter (very rough)
-    return [c.lower() for c in word if c.isalpha()]
+    return tuple(c.lower() for c in word if c.isalpha())
 
 
-# Emphasis -> prosody mappings
-_EMPHASIS_VOLUME = {"none": 0.5, "soft": 0.3, "loud": 0.8, "shout": 1.0}
-_EMPHASIS_BREATHINESS = {"none": 0.0, "soft": 0.6, "loud": 0.0, "shout": 0.0}
-_EMPHASIS_PITCH_MULT = {"none": 1.0, "soft": 0.9, "loud": 1.1, "shout": 1.2}
+# Emphasis -> (volume, breathiness, pitch multiplier), one lookup per token
+_EMPHASIS_PROSODY = {
+    "none": (0.5, 0.0, 1.0),
+    "soft": (0.3, 0.6, 0.9),
+    "loud": (0.8, 0.0, 1.1),
+    "shout": (1.0, 0.0, 1.2),
+}
+_DEFAULT_PROSODY = _EMPHASIS_PROSODY["none"]
 
 
 class MockLLMProcessor(LLMProcessor):
@@ -115,9 +120,9 @@ class MockLLMProcessor(LLMProcessor):
 
         for token in tokens:
             phonemes = _word_to_phonemes(token.text)
-            volume = _EMPHASIS_VOLUME.get(token.emphasis, 0.5)
-            breathiness = _EMPHASIS_BREATHINESS.get(token.emphasis, 0.0)
-            pitch_mult = _EMPHASIS_PITCH_MULT.get(token.emphasis, 1.0)
+            volume, breathiness, pitch_mult = _EMPHASIS_PROSODY.get(
+                token.emphasis, _DEFAULT_PROSODY
+            )
             pitch_hz = self.base_pitch_hz * pitch_mult
 
             duration_ms = int(self.base_duration_ms * token.duration_modifier)
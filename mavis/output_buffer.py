@@ -16,6 +16,10 @@ from mavis.llm_processor import PhonemeEvent
 class BufferState:
     """Snapshot of the output buffer status."""
 
+    # One snapshot is built per pipeline tick; slots skip the per-instance
+    # __dict__ (dataclass(slots=True) needs Python 3.10)
+    __slots__ = ("level", "status", "drain_rate", "fill_rate")
+
     level: float  # 0.0 - 1.0
     status: str  # "underflow" | "optimal" | "overflow"
     drain_rate: float  # phonemes consumed per second
@@ -1,7 +1,7 @@
 """Pipeline orchestrator -- wires all components into a single runnable pipeline."""
 
 import time
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from mavis.audio import AudioSynthesizer, MockAudioSynthesizer
 from mavis.config import MavisConfig
@@ -13,7 +13,7 @@ from mavis.llm_processor import (
     MockLLMProcessor,
     PhonemeEvent,
 )
-from mavis.output_buffer import OutputBuffer
+from mavis.output_buffer import BufferState, OutputBuffer
 from mavis.sheet_text import SheetTextToken, parse
 from mavis.voice import VoiceProfile, get_voice
 
@@ -121,6 +121,16 @@ class MavisPipeline:
 
         Returns the current pipeline state dict.
         """
+        return self.tick_with_buffer_state(elapsed_ms)[0]
+
+    def tick_with_buffer_state(self, elapsed_ms: int = 33) -> Tuple[Dict, BufferState]:
+        """Advance the pipeline by one frame, like ``tick()``.
+
+        Returns ``(state, buffer_state)``, where ``buffer_state`` is the
+        output buffer snapshot the state dict was built from. Callers that
+        also need the BufferState (e.g. ``ScoreTracker.on_tick``) get it
+        without taking a second snapshot.
+        """
         # Step 1: Consume input
         chars = self.input_buffer.consume(self._chunk_size)
 
@@ -157,16 +167,29 @@ class MavisPipeline:
             self._last_audio = None
 
         # Record buffer state
+        buf_state = self.output_buffer.state()
         if self.recording is not None:
-            self.recording.record_buffer_state(
-                self._elapsed_ms(), self.output_buffer.state()
-            )
+            self.recording.record_buffer_state(self._elapsed_ms(), buf_state)
 
-        return self.state()
+        return self._state_from(buf_state), buf_state
+
+    def drain(self, max_ticks: int = 200) -> List[Tuple[Dict, BufferState]]:
+        """Tick until the output buffer is empty or ``max_ticks`` ticks have run.
+
+        Returns the ``(state, buffer_state)`` pair from each tick, in order,
+        so callers can score or display the drain after the fact.
+        """
+        results: List[Tuple[Dict, BufferState]] = []
+        while self.output_buffer.size() > 0 and len(results) < max_ticks:
+            results.append(self.tick_with_buffer_state())
+        return results
 
     def state(self) -> Dict:
         """Return combined pipeline state."""
-        buf_state = self.output_buffer.state()
+        return self._state_from(self.output_buffer.state())
+
+    def _state_from(self, buf_state: BufferState) -> Dict:
+        """Build the pipeline state dict around an output buffer snapshot."""
         return {
             "input_buffer_level": self.input_buffer.level(),
             "input_buffer_size": self.input_buffer.size(),
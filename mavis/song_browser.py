@@ -1,9 +1,14 @@
 """Song browser -- list, filter, and select songs from the library."""
 
-from typing import Dict, List, Optional
+import os
+from typing import Dict, List, Optional, Tuple
 
 from mavis.songs import Song, list_songs
 
+# Sorted library per directory, with the (filename, mtime_ns) signature of
+# the song files it was parsed from
+_LIBRARY_CACHE: Dict[str, Tuple[Tuple[Tuple[str, int], ...], List[Song]]] = {}
+
 
 def browse_songs(
     directory: str = "songs",
@@ -19,10 +24,10 @@ def browse_songs(
     Returns:
         List of Song objects sorted by difficulty then title.
     """
-    songs = list_songs(directory)
+    songs = _load_library(directory)
     if difficulty is not None:
-        songs = [s for s in songs if s.difficulty == difficulty]
-    return sorted(songs, key=lambda s: (_difficulty_order(s.difficulty), s.title))
+        return [s for s in songs if s.difficulty == difficulty]
+    return list(songs)
 
 
 def group_by_difficulty(songs: List[Song]) -> Dict[str, List[Song]]:
@@ -56,6 +61,32 @@ def format_song_list(songs: List[Song]) -> str:
     return "\n".join(lines)
 
 
+def _load_library(directory: str) -> List[Song]:
+    """Return the sorted song library, re-parsing only when a song file changed.
+
+    The cache is keyed on each .json file's name and mtime, so adding,
+    removing or editing a song invalidates it; otherwise the directory is
+    only listed and stat'ed, never re-parsed.
+    """
+    if not os.path.isdir(directory):
+        return []
+    signature = tuple(sorted(
+        (entry.name, entry.stat().st_mtime_ns)
+        for entry in os.scandir(directory)
+        if entry.name.endswith(".json")
+    ))
+    key = os.path.abspath(directory)
+    cached = _LIBRARY_CACHE.get(key)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+    songs = sorted(
+        list_songs(directory),
+        key=lambda s: (_difficulty_order(s.difficulty), s.title),
+    )
+    _LIBRARY_CACHE[key] = (signature, songs)
+    return songs
+
+
 def _difficulty_order(difficulty: str) -> int:
     """Return a sort key for difficulty ordering."""
     return {"easy": 0, "medium": 1, "hard": 2}.get(difficulty, 3)
@@ -6,11 +6,24 @@ from concurrent process access.
 
 import fcntl
 import json
+import mmap
 import os
 import tempfile
 from contextlib import contextmanager
 from typing import Any
 
+# Optional fast JSON codec; falls back to the stdlib json module
+try:
+    import orjson  # type: ignore
+except ImportError:
+    orjson = None
+
+# Stdlib encoders, built once and shared: json.dumps() constructs a new
+# JSONEncoder on every call that passes options. Non-ASCII text is kept as
+# UTF-8, matching orjson, instead of being \u-escaped.
+_PRETTY_ENCODER = json.JSONEncoder(indent=2, ensure_ascii=False)
+_COMPACT_ENCODER = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False)
+
 
 @contextmanager
 def locked_open(path: str, mode: str = "r"):
@@ -31,11 +44,12 @@ def locked_open(path: str, mode: str = "r"):
         f.close()
 
 
-def atomic_json_save(path: str, data: Any) -> None:
+def atomic_json_save(path: str, data: Any, pretty: bool = False) -> None:
     """Write JSON data atomically with file locking.
 
     1. Creates a temp file in the same directory.
-    2. Writes JSON data to the temp file.
+    2. Writes JSON data to the temp file (via orjson when installed).
+       Output is compact unless ``pretty`` is set, which indents by 2.
     3. Atomically replaces the target file via os.replace().
     4. On failure, cleans up the temp file.
 
@@ -46,9 +60,9 @@ def atomic_json_save(path: str, data: Any) -> None:
     os.makedirs(dir_path, exist_ok=True)
     fd, tmp = tempfile.mkstemp(dir=dir_path, suffix=".tmp")
     try:
-        with os.fdopen(fd, "w") as f:
+        with os.fdopen(fd, "wb") as f:
             fcntl.flock(f.fileno(), fcntl.LOCK_EX)
-            json.dump(data, f, indent=2)
+            f.write(json_dumps_bytes(data, pretty))
             f.flush()
             os.fsync(f.fileno())
         os.replace(tmp, path)
@@ -67,5 +81,25 @@ def locked_json_load(path: str) -> Any:
     """
     if not os.path.isfile(path) or os.path.getsize(path) == 0:
         return None
-    with locked_open(path, "r") as f:
-        return json.load(f)
+    with locked_open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return None
+        if orjson is not None:
+            # Parse straight from the page cache instead of copying the
+            # file into a bytes object first. Writers replace the file
+            # atomically, so the mapped inode is never truncated under us.
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                with memoryview(mm) as view:
+                    return orjson.loads(view)
+        return json.loads(f.read())
+
+
+def json_dumps_bytes(data: Any, pretty: bool = False) -> bytes:
+    """Encode data as UTF-8 JSON, using orjson when installed."""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, option=option)
+    encoder = _PRETTY_ENCODER if pretty else _COMPACT_ENCODER
+    return encoder.encode(data).encode("utf-8")
@@ -219,6 +219,10 @@ def format_lesson_list(progress: Optional[TutorialProgress] = None) -> str:
     return "\n".join(lines)
 
 
+# Letter grade -> numeric value for comparison (unknown grades rank 0)
+_GRADE_VALUES = {"S": 6, "A": 5, "B": 4, "C": 3, "D": 2, "F": 1}
+
+
 def _grade_value(grade: str) -> int:
     """Convert a letter grade to a numeric value for comparison."""
-    return {"S": 6, "A": 5, "B": 4, "C": 3, "D": 2, "F": 1}.get(grade, 0)
+    return _GRADE_VALUES.get(grade, 0)
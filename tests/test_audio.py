@@ -59,3 +59,12 @@ def test_zero_duration():
 def test_play_no_error():
     synth = MockAudioSynthesizer()
     synth.play(b"\x00\x00")  # should not raise
+
+
+def test_repeated_notes_share_cached_pcm():
+    synth = MockAudioSynthesizer()
+    a = PhonemeEvent(phoneme="ah", start_ms=0, duration_ms=80, volume=0.7, pitch_hz=330.0,
+                     harmony_intervals=[4, 7])
+    b = PhonemeEvent(phoneme="oh", start_ms=500, duration_ms=80, volume=0.7, pitch_hz=330.0,
+                     harmony_intervals=[4, 7])
+    assert synth.synthesize(a) is synth.synthesize(b)
@@ -3,9 +3,11 @@
 import json
 import os
 import tempfile
+from dataclasses import asdict
 
 from mavis.export import (
     PerformanceRecording,
+    emotion_from_features,
     extract_training_features,
     export_dataset,
     export_performance,
@@ -51,6 +53,11 @@ def test_tokens_to_iml_valid_xml():
     assert "</utterance>" in iml
 
 
+def test_tokens_to_iml_escapes_xml():
+    iml = tokens_to_iml([SheetTextToken(text='a<b> & "c"')])
+    assert "a&lt;b&gt; &amp; &quot;c&quot;" in iml
+
+
 def test_tokens_to_iml_prosody_tags():
     tokens = _make_tokens()
     iml = tokens_to_iml(tokens)
@@ -132,6 +139,11 @@ def test_infer_emotion_sad():
     assert infer_emotion(events) == "sad"
 
 
+def test_infer_emotion_quiet_breathy_is_sad():
+    events = [PhonemeEvent(phoneme="ah", volume=0.2, pitch_hz=220.0, breathiness=0.8)]
+    assert infer_emotion(events) == "sad"
+
+
 def test_infer_emotion_calm():
     events = [PhonemeEvent(phoneme="ah", volume=0.2, pitch_hz=220.0)]
     assert infer_emotion(events) == "calm"
@@ -141,6 +153,13 @@ def test_infer_emotion_empty():
     assert infer_emotion([]) == "neutral"
 
 
+def test_emotion_from_features_matches_infer_emotion():
+    for vol, pitch, breath in [(0.9, 300.0, 0.0), (0.9, 180.0, 0.0),
+                               (0.5, 220.0, 0.8), (0.2, 220.0, 0.0), (0.5, 220.0, 0.0)]:
+        events = [PhonemeEvent(phoneme="ah", volume=vol, pitch_hz=pitch, breathiness=breath)]
+        assert emotion_from_features(extract_training_features(events)) == infer_emotion(events)
+
+
 # --- Training features ---
 
 def test_extract_training_features():
@@ -191,6 +210,16 @@ def test_recording_events():
     assert len(rec.events) == 4
 
 
+def test_recording_to_dict_matches_asdict():
+    rec = PerformanceRecording(transcript="the SUN rises", score=10)
+    rec.record_keystroke(0, "a", {"shift": False})
+    for tok in _make_tokens():
+        rec.record_token(5, tok)
+    for ev in _make_events():
+        rec.record_phoneme(10, ev)
+    assert rec.to_dict() == asdict(rec)
+
+
 # --- Dataset entry ---
 
 def test_recording_to_dataset_entry():
@@ -242,6 +271,21 @@ def test_export_performance_writes_json():
         assert "<iml" in data["iml"]
 
 
+def test_export_performance_stdlib_fallback(monkeypatch):
+    import mavis.storage as storage
+
+    monkeypatch.setattr(storage, "orjson", None)
+    rec = PerformanceRecording(transcript="caf\u00e9", consent=True)
+    rec.record_phoneme(0, PhonemeEvent(phoneme="k", duration_ms=100))
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, "entry.json")
+        export_performance(rec, path)
+        with open(path) as f:
+            data = json.load(f)
+        assert data == recording_to_dataset_entry(rec)
+
+
 def test_export_dataset_creates_directory():
     rec1 = PerformanceRecording(transcript="one", consent=True)
     rec1.record_phoneme(0, PhonemeEvent(phoneme="w", duration_ms=100))
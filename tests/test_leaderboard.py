@@ -89,6 +89,36 @@ def test_filter_by_difficulty():
         assert medium[0]["difficulty"] == "medium"
 
 
+def test_filter_by_difficulty_tracks_submissions():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        lb = _make_lb(tmpdir)  # max_entries_per_song=5
+        for i in range(5):
+            lb.submit(LeaderboardEntry(
+                player_name=f"E{i}",
+                score=100 + i,
+                grade="C",
+                song_id="twinkle",
+                difficulty="easy",
+            ))
+        assert len(lb.get_scores("twinkle", difficulty="easy")) == 5
+        assert lb.get_scores("twinkle", difficulty="hard") == []
+
+        # A hard score pushes the lowest easy score off the full board
+        lb.submit(LeaderboardEntry(
+            player_name="H",
+            score=500,
+            grade="A",
+            song_id="twinkle",
+            difficulty="hard",
+        ))
+        assert [e["player_name"] for e in lb.get_scores("twinkle", difficulty="hard")] == ["H"]
+        easy = lb.get_scores("twinkle", difficulty="easy")
+        assert [e["player_name"] for e in easy] == ["E4", "E3", "E2", "E1"]
+
+        lb.clear("twinkle")
+        assert lb.get_scores("twinkle", difficulty="hard") == []
+
+
 def test_persistence():
     with tempfile.TemporaryDirectory() as tmpdir:
         path = os.path.join(tmpdir, "lb.json")
@@ -165,3 +195,104 @@ def test_format_scores():
         text = lb.format_scores("twinkle")
         assert "Alice" in text
         assert "500" in text
+
+
+def test_low_score_on_full_board_not_saved():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        lb = _make_lb(tmpdir)  # max_entries_per_song=5
+        for i in range(5):
+            lb.submit(LeaderboardEntry(
+                player_name=f"P{i}",
+                score=1000 + i,
+                grade="A",
+                song_id="twinkle",
+                difficulty="easy",
+            ))
+        saves = []
+        lb._save = lambda: saves.append(True)
+        rank = lb.submit(LeaderboardEntry(
+            player_name="Low",
+            score=10,
+            grade="F",
+            song_id="twinkle",
+            difficulty="easy",
+        ))
+        assert rank == 0
+        assert saves == []
+        assert len(lb.get_scores("twinkle")) == 5
+
+
+def test_tied_score_ranks_after_earlier_entry():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        lb = _make_lb(tmpdir)
+        ranks = [
+            lb.submit(LeaderboardEntry(
+                player_name=name,
+                score=score,
+                grade="B",
+                song_id="twinkle",
+                difficulty="easy",
+            ))
+            for name, score in [("First", 500), ("High", 900), ("Second", 500)]
+        ]
+        assert ranks == [1, 1, 3]
+        names = [e["player_name"] for e in lb.get_scores("twinkle")]
+        assert names == ["High", "First", "Second"]
+
+
+def test_flush_every_n_batches_writes():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, "lb.json")
+        lb = Leaderboard(path=path, flush_every_n=3)
+        for i in range(2):
+            lb.submit(LeaderboardEntry(
+                player_name=f"P{i}",
+                score=100 * i,
+                grade="C",
+                song_id="twinkle",
+                difficulty="easy",
+            ))
+        assert not os.path.exists(path)
+        lb.flush()
+        assert len(Leaderboard(path=path).get_scores("twinkle")) == 2
+
+        lb.clear()
+        lb.clear()
+        assert len(Leaderboard(path=path).get_scores("twinkle")) == 2
+        lb.clear()
+        assert Leaderboard(path=path).get_scores("twinkle") == []
+
+
+def test_load_reuses_parse_until_file_changes(monkeypatch):
+    import mavis.leaderboard as leaderboard
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, "lb.json")
+        writer = Leaderboard(path=path)
+        writer.submit(LeaderboardEntry(
+            player_name="Alice",
+            score=100,
+            grade="C",
+            song_id="twinkle",
+            difficulty="easy",
+        ))
+
+        loads = []
+        real_load = leaderboard.locked_json_load
+
+        def counting_load(p):
+            loads.append(p)
+            return real_load(p)
+
+        monkeypatch.setattr(leaderboard, "locked_json_load", counting_load)
+        first = Leaderboard(path=path)
+        first.get_scores("twinkle")[0]["player_name"] = "Mallory"
+        second = Leaderboard(path=path)
+        assert len(loads) == 1
+        assert second.get_scores("twinkle")[0]["player_name"] == "Alice"
+
+        # Rewrite with a different size so the change is visible to stat()
+        with open(path, "w") as f:
+            json.dump({"songs": {}}, f)
+        assert Leaderboard(path=path).get_scores("twinkle") == []
+        assert len(loads) == 2
@@ -70,3 +70,23 @@ def test_full_flow():
             phonemes_seen.append(state["last_phoneme"])
 
     assert len(phonemes_seen) > 0
+
+
+def test_tick_with_buffer_state():
+    pipe = create_pipeline()
+    pipe.feed_text("the SUN rises")
+    state, buf_state = pipe.tick_with_buffer_state()
+    assert state["output_buffer_level"] == buf_state.level
+    assert state["output_buffer_status"] == buf_state.status
+    assert state["output_drain_rate"] == buf_state.drain_rate
+
+
+def test_drain_empties_output_buffer():
+    pipe = create_pipeline()
+    pipe.feed_text("the SUN... is falling")
+    for _ in range(10):
+        pipe.tick()
+    results = pipe.drain()
+    assert pipe.output_buffer.size() == 0
+    assert all(buf_state.status for _, buf_state in results)
+    assert pipe.drain() == []
@@ -1,5 +1,6 @@
 """Tests for mavis.song_browser."""
 
+import json
 import os
 
 from mavis.song_browser import (
@@ -84,3 +85,17 @@ def test_format_song_list():
 def test_format_song_list_empty():
     text = format_song_list([])
     assert "no songs" in text.lower()
+
+
+def test_browse_songs_picks_up_added_song(tmp_dir):
+    def write_song(name, title, difficulty):
+        with open(os.path.join(tmp_dir, name), "w") as f:
+            json.dump({"title": title, "bpm": 100, "difficulty": difficulty,
+                       "sheet_text": "la la"}, f)
+
+    write_song("a.json", "Alpha", "hard")
+    assert [s.title for s in browse_songs(tmp_dir)] == ["Alpha"]
+
+    write_song("b.json", "Beta", "easy")
+    assert [s.title for s in browse_songs(tmp_dir)] == ["Beta", "Alpha"]
+    assert [s.title for s in browse_songs(tmp_dir, difficulty="hard")] == ["Alpha"]
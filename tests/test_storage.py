@@ -80,3 +80,22 @@ def test_locked_open_write():
         assert data == {"written": True}
     finally:
         os.unlink(path)
+
+
+def test_atomic_json_save_stdlib_fallback(monkeypatch, tmp_json_path):
+    import mavis.storage as storage
+
+    monkeypatch.setattr(storage, "orjson", None)
+    atomic_json_save(tmp_json_path, {"songs": {"twinkle": [{"score": 5, "name": "é"}]}})
+    assert locked_json_load(tmp_json_path) == {
+        "songs": {"twinkle": [{"score": 5, "name": "é"}]}
+    }
+
+
+def test_atomic_json_save_compact_by_default(tmp_json_path):
+    atomic_json_save(tmp_json_path, {"a": [1, 2]})
+    with open(tmp_json_path) as f:
+        assert f.read() == '{"a":[1,2]}'
+    atomic_json_save(tmp_json_path, {"a": [1, 2]}, pretty=True)
+    with open(tmp_json_path) as f:
+        assert f.read() == '{\n  "a": [\n    1,\n    2\n  ]\n}'
@@ -153,8 +153,7 @@ class GameSession:
         self.pipeline.feed(char, mods)
         self.chars_typed += 1
 
-        state = self.pipeline.tick()
-        buf_state = self.pipeline.output_buffer.state()
+        state, buf_state = self.pipeline.tick_with_buffer_state()
         self.tracker.on_tick(buf_state)
 
         if state["last_phoneme"]:
@@ -176,8 +175,7 @@ class GameSession:
 
     def tick_idle(self):
         """Tick the pipeline without input (drain buffer)."""
-        state = self.pipeline.tick()
-        buf_state = self.pipeline.output_buffer.state()
+        state, buf_state = self.pipeline.tick_with_buffer_state()
         self.tracker.on_tick(buf_state)
 
         if state["last_phoneme"]: